@@ -2,27 +2,76 @@ from datetime import datetime, timezone
 import streamlit as st
 import matplotlib.pyplot as plt
 
-from momentum_bt.data.binance import build_close_series as build_crypto_close_series
-from momentum_bt.data.moex import build_close_series as build_moex_close_series
-from momentum_bt.data.moex_universe import load_imoex_universe
-
-from momentum_bt.backtest import BacktestParams, run_momentum_backtest
-from momentum_bt.metrics import summary_stats
-from momentum_bt.plots import plot_equity, plot_drawdown, plot_turnover
+from momentum_bt.data.binance import build_ohlcv_panel as build_crypto_panel
+from momentum_bt.data.moex import build_ohlcv_panel as build_moex_panel
+from momentum_bt.data.binance_universe import load_binance_universe, load_listing_dates, listing_mask
+from momentum_bt.data.moex_universe import load_imoex_universe, load_imoex_history, imoex_membership_mask
+
+from momentum_bt.backtest import (
+    BacktestParams,
+    SPARSE_WEIGHTS_MIN_ASSETS,
+    fit_top_bottom,
+    run_momentum_backtest,
+)
+from momentum_bt.portfolio.weights import WEIGHTING_SCHEMES
+from momentum_bt.defaults import (
+    APP_DEFAULT_PARAMS as DEFAULTS,
+    DEFAULT_BOARD,
+    DEFAULT_CRYPTO_SYMBOLS,
+    DEFAULT_END,
+    DEFAULT_ROLLING_WINDOW,
+    DEFAULT_START,
+)
+from momentum_bt.prewarm import load_published
+from momentum_bt.metrics import summary_stats, rolling_sharpe
+from momentum_bt.plots import plot_equity, plot_drawdown, plot_turnover, plot_rolling_sharpe
 
 
 st.set_page_config(page_title="Momentum Backtester", layout="wide")
 st.title("Momentum Backtester (Crypto / MOEX)")
 
 
+@st.cache_data(ttl=5 * 60)  # 5 minutes: pick up new pre-warm runs quickly
+def cached_published(name: str):
+    return load_published(name)
+
+
 @st.cache_data(ttl=6 * 60 * 60)  # 6 hours
 def cached_imoex_universe() -> list[str]:
+    pub = cached_published("imoex")
+    if pub is not None and pub.meta.get("current_universe"):
+        return pub.meta["current_universe"]
     return load_imoex_universe()
 
 
+@st.cache_data(ttl=60 * 60)  # 1 hour (market snapshot itself is cached on disk for 6 hours)
+def cached_binance_universe(quote_asset: str, min_quote_volume: float, top_n: int) -> list[str]:
+    return load_binance_universe(quote_asset=quote_asset, min_quote_volume=min_quote_volume, top_n=top_n)
+
+
+@st.cache_data(ttl=60 * 60)  # 1 hour; on-disk cache only fetches new / not-yet-listed symbols
+def cached_listing_dates(symbols: tuple[str, ...]) -> dict[str, str]:
+    return load_listing_dates(list(symbols))
+
+
+@st.cache_data(ttl=6 * 60 * 60)  # 6 hours (on-disk cache only fetches new dates)
+def cached_imoex_history(start_dt: datetime, end_dt: datetime) -> dict[str, list[str]]:
+    pub = cached_published("imoex")
+    if (
+        pub is not None
+        and "imoex_history" in pub.meta
+        and (pub.meta["start"], pub.meta["end"]) == (start_dt.isoformat(), end_dt.isoformat())
+    ):
+        return pub.meta["imoex_history"]
+    return load_imoex_history(start_dt, end_dt)
+
+
 @st.cache_data(ttl=60 * 60)  # 1 hour
-def cached_crypto_prices(symbols: tuple[str, ...], start_dt: datetime, end_dt: datetime):
-    return build_crypto_close_series(
+def cached_crypto_panel(symbols: tuple[str, ...], start_dt: datetime, end_dt: datetime):
+    pub = cached_published("crypto")
+    if pub is not None and pub.matches_data(symbols, start_dt, end_dt):
+        return pub.panel
+    return build_crypto_panel(
         symbols=list(symbols),
         interval="1d",
         start=start_dt,
@@ -31,8 +80,11 @@ def cached_crypto_prices(symbols: tuple[str, ...], start_dt: datetime, end_dt: d
 
 
 @st.cache_data(ttl=60 * 60)  # 1 hour
-def cached_moex_prices(tickers: tuple[str, ...], start_dt: datetime, end_dt: datetime, board: str):
-    return build_moex_close_series(
+def cached_moex_panel(tickers: tuple[str, ...], start_dt: datetime, end_dt: datetime, board: str):
+    pub = cached_published("imoex")
+    if pub is not None and pub.matches_data(tickers, start_dt, end_dt, board):
+        return pub.panel
+    return build_moex_panel(
         tickers=list(tickers),
         start=start_dt,
         end=end_dt,
@@ -40,22 +92,50 @@ def cached_moex_prices(tickers: tuple[str, ...], start_dt: datetime, end_dt: dat
     )
 
 
+def _to_utc_dt(d) -> datetime:
+    return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+
+
 with st.sidebar:
     st.header("Market & Data")
 
     market = st.selectbox("Market", ["Crypto (Binance)", "MOEX"])
 
-    start = st.date_input("Start date", value=datetime(2022, 1, 1).date())
-    end = st.date_input("End date", value=datetime(2024, 12, 31).date())
+    start = st.date_input("Start date", value=DEFAULT_START.date())
+    end = st.date_input("End date", value=DEFAULT_END.date())
 
     if market == "Crypto (Binance)":
-        symbols = st.multiselect(
-            "Crypto symbols",
-            ["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"],
-            default=["BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT"],
+        st.subheader("Crypto universe")
+        crypto_mode = st.radio(
+            "Universe",
+            ["Custom symbols", "Top by 24h volume"],
+            index=0,
         )
+
+        if crypto_mode == "Top by 24h volume":
+            quote_asset = st.text_input("Quote asset", value="USDT").strip().upper()
+            universe_top = st.number_input("Top pairs by volume", min_value=5, max_value=500, value=50, step=5)
+            min_quote_volume = st.number_input(
+                "Min 24h quote volume", min_value=0.0, value=0.0, step=1_000_000.0, format="%.0f"
+            )
+            try:
+                symbols = cached_binance_universe(quote_asset, float(min_quote_volume), int(universe_top))
+                st.caption(f"Selected {len(symbols)} {quote_asset} pairs.")
+                with st.expander("Show symbols"):
+                    st.write(", ".join(symbols))
+            except Exception as e:
+                symbols = []
+                st.error("Failed to load Binance universe")
+                st.exception(e)
+        else:
+            symbols = st.multiselect(
+                "Crypto symbols",
+                list(DEFAULT_CRYPTO_SYMBOLS),
+                default=list(DEFAULT_CRYPTO_SYMBOLS),
+            )
         tickers = []
         board = "TQBR"
+        point_in_time = False
     else:
         st.subheader("MOEX universe")
         universe_mode = st.radio(
@@ -64,12 +144,23 @@ with st.sidebar:
             index=0,
         )
 
-        board = st.text_input("Board", value="TQBR", help="Most liquid shares board is usually TQBR.")
+        board = st.text_input("Board", value=DEFAULT_BOARD, help="Most liquid shares board is usually TQBR.")
 
+        point_in_time = False
         if universe_mode == "IMOEX (index constituents)":
+            point_in_time = st.checkbox(
+                "Point-in-time membership",
+                value=True,
+                help="Rank only stocks that were in IMOEX on each rebalance date.",
+            )
             try:
-                tickers = cached_imoex_universe()
-                st.caption(f"Loaded {len(tickers)} tickers from IMOEX.")
+                if point_in_time:
+                    imoex_history = cached_imoex_history(_to_utc_dt(start), _to_utc_dt(end))
+                    tickers = sorted({t for ts in imoex_history.values() for t in ts})
+                    st.caption(f"Loaded {len(tickers)} historical IMOEX constituents ({len(imoex_history)} snapshots).")
+                else:
+                    tickers = cached_imoex_universe()
+                    st.caption(f"Loaded {len(tickers)} tickers from IMOEX.")
                 with st.expander("Show tickers"):
                     st.write(", ".join(tickers))
             except Exception as e:
@@ -85,22 +176,59 @@ with st.sidebar:
             tickers = [x.strip().upper() for x in tickers_str.split(",") if x.strip()]
 
         symbols = []
+        crypto_mode = None
 
     st.header("Strategy parameters")
-    lookback = st.number_input("Lookback (days)", min_value=5, max_value=365, value=60, step=5)
-    rebalance_days = st.number_input("Rebalance (days)", min_value=1, max_value=90, value=21, step=1)
-    top_n = st.number_input("Top N", min_value=1, max_value=50, value=10, step=1)
-    bottom_n = st.number_input("Bottom N", min_value=0, max_value=50, value=10, step=1)
-    tc = st.number_input("Transaction cost", min_value=0.0, max_value=0.01, value=0.0005, step=0.0001, format="%.4f")
-    gross = st.number_input("Gross exposure", min_value=0.5, max_value=5.0, value=2.0, step=0.1)
+    lookback = st.number_input("Lookback (days)", min_value=5, max_value=365, value=DEFAULTS.lookback, step=5)
+    rebalance_days = st.number_input("Rebalance (days)", min_value=1, max_value=90, value=DEFAULTS.rebalance_days, step=1)
+    top_n = st.number_input("Top N", min_value=1, max_value=50, value=DEFAULTS.top_n, step=1)
+    bottom_n = st.number_input("Bottom N", min_value=0, max_value=50, value=DEFAULTS.bottom_n, step=1)
+    tc = st.number_input("Transaction cost", min_value=0.0, max_value=0.01, value=DEFAULTS.transaction_cost, step=0.0001, format="%.4f")
+    gross = st.number_input("Gross exposure", min_value=0.5, max_value=5.0, value=DEFAULTS.gross_exposure, step=0.1)
+    weighting = st.selectbox(
+        "Leg weighting",
+        list(WEIGHTING_SCHEMES),
+        index=WEIGHTING_SCHEMES.index(DEFAULTS.weighting),
+        help="equal: 1/N per leg; inverse_vol: 1/volatility; risk_parity: equal risk contribution "
+        "(EWMA covariance). Each leg keeps its gross exposure.",
+    )
+    vol_window = st.number_input("Volatility window (days)", min_value=5, max_value=365, value=DEFAULTS.vol_window, step=5)
+    ewma_halflife = st.number_input(
+        "EWMA covariance half-life (days)", min_value=2.0, max_value=250.0, value=DEFAULTS.ewma_halflife, step=1.0
+    )
+    rolling_window = st.number_input("Rolling window (days)", min_value=10, max_value=365, value=DEFAULT_ROLLING_WINDOW, step=1)
+
+    st.header("Liquidity & slippage")
+    min_traded_value = st.number_input(
+        "Min avg traded value (per day)",
+        min_value=0.0,
+        value=DEFAULTS.min_traded_value,
+        step=1_000_000.0,
+        format="%.0f",
+        help="Quote currency (USDT) for crypto, RUB for MOEX. 0 disables the filter.",
+    )
+    liquidity_window = st.number_input("Liquidity window (days)", min_value=1, max_value=120, value=DEFAULTS.liquidity_window, step=1)
+    capital = st.number_input(
+        "Capital (for participation slippage)",
+        min_value=0.0,
+        value=DEFAULTS.capital,
+        step=100_000.0,
+        format="%.0f",
+        help="Portfolio notional. 0 disables slippage (flat transaction cost only).",
+    )
+    impact_coef = st.number_input("Impact coefficient", min_value=0.0, max_value=5.0, value=DEFAULTS.impact_coef, step=0.05)
+    max_participation = st.number_input(
+        "Max participation",
+        min_value=0.01,
+        max_value=10.0,
+        value=DEFAULTS.max_participation,
+        step=0.1,
+        help="Cap on trade size / avg traded value; also used when traded value is zero or unknown.",
+    )
 
     run_btn = st.button("Run backtest", type="primary")
 
 
-def _to_utc_dt(d) -> datetime:
-    return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
-
-
 if run_btn:
     start_dt = _to_utc_dt(start)
     end_dt = _to_utc_dt(end)
@@ -115,7 +243,7 @@ if run_btn:
                 st.error("Choose at least one crypto symbol.")
                 st.stop()
 
-            prices = cached_crypto_prices(tuple(symbols), start_dt, end_dt)
+            panel = cached_crypto_panel(tuple(symbols), start_dt, end_dt)
             periods_per_year = 365
 
         else:
@@ -123,14 +251,14 @@ if run_btn:
                 st.error("MOEX ticker list is empty. Choose IMOEX universe or provide tickers.")
                 st.stop()
 
-            prices = cached_moex_prices(tuple(tickers), start_dt, end_dt, board.strip().upper())
+            panel = cached_moex_panel(tuple(tickers), start_dt, end_dt, board.strip().upper())
             periods_per_year = 252
 
-        if prices is None or prices.empty:
+        if panel is None or panel.empty:
             st.error("No price data returned. Check tickers/symbols and date range.")
             st.stop()
 
-        prices = prices.dropna(axis=1, how="all")
+        prices = panel.close.dropna(axis=1, how="all")
 
         n_assets = prices.shape[1]
 
@@ -141,9 +269,7 @@ if run_btn:
                 f"Top N + Bottom N = {requested} is too large for {n_assets} instruments. "
                 f"Auto-adjusting."
             )
-            max_side = max(1, n_assets // 2)
-            top_n = min(int(top_n), max_side)
-            bottom_n = min(int(bottom_n), max_side)
+            top_n, bottom_n = fit_top_bottom(int(top_n), int(bottom_n), n_assets)
 
         params = BacktestParams(
             lookback=int(lookback),
@@ -152,16 +278,49 @@ if run_btn:
             bottom_n=int(bottom_n),
             transaction_cost=float(tc),
             gross_exposure=float(gross),
+            min_traded_value=float(min_traded_value),
+            liquidity_window=int(liquidity_window),
+            capital=float(capital),
+            impact_coef=float(impact_coef),
+            max_participation=float(max_participation),
+            sparse_weights=n_assets > SPARSE_WEIGHTS_MIN_ASSETS,
+            weighting=weighting,
+            vol_window=int(vol_window),
+            ewma_halflife=float(ewma_halflife),
         )
 
-        res = run_momentum_backtest(prices, params)
+        # Use the pre-warmed default-parameter backtest when everything matches
+        if market == "Crypto (Binance)":
+            pub = cached_published("crypto")
+            pub_ok = pub is not None and pub.matches_data(symbols, start_dt, end_dt)
+            mask_kind = "listing" if crypto_mode == "Top by 24h volume" else None
+        else:
+            pub = cached_published("imoex")
+            pub_ok = pub is not None and pub.matches_data(tickers, start_dt, end_dt, board.strip().upper())
+            mask_kind = "imoex_pit" if point_in_time else None
+
+        if pub_ok and pub.matches_run(params, mask_kind):
+            res = pub.result
+        else:
+            universe_mask = None
+            if point_in_time:
+                universe_mask = imoex_membership_mask(imoex_history, prices.index, prices.columns)
+            elif crypto_mode == "Top by 24h volume":
+                listing_dates = cached_listing_dates(tuple(prices.columns))
+                universe_mask = listing_mask(listing_dates, prices.index, prices.columns)
+
+            res = run_momentum_backtest(prices, params, universe_mask=universe_mask, panel=panel)
+
         stats = summary_stats(res["net_ret"], res["equity"], periods_per_year=periods_per_year)
 
         # Show last rebalance winners / losers
         if "weights" in res:
             st.subheader("Current portfolio (last rebalance)")
 
-            last_w = res["weights"].iloc[-1].sort_values(ascending=False)
+            if params.sparse_weights:
+                last_w = res["weights"].latest().sort_values(ascending=False)
+            else:
+                last_w = res["weights"].iloc[-1].sort_values(ascending=False)
 
             cL, cS = st.columns(2)
 
@@ -183,6 +342,11 @@ if run_btn:
         st.write(f"Rows (dates): {prices.shape[0]}")
         st.write(f"Columns (instruments): {prices.shape[1]}")
         st.write(f"Periods/year: {periods_per_year}")
+        if pub_ok:
+            st.caption(
+                f"Pre-warmed data, refreshed {pub.age_s / 3600:.1f}h ago "
+                f"(warm-up took {pub.meta['duration_s']:.0f}s)."
+            )
 
     with c2:
         st.subheader("Plots")
@@ -196,6 +360,10 @@ if run_btn:
         plot_turnover(res["turnover"], title="Turnover")
         st.pyplot(plt.gcf(), clear_figure=True)
 
+        rolling_sr = rolling_sharpe(res["net_ret"], int(rolling_window), periods_per_year=periods_per_year)
+        plot_rolling_sharpe(rolling_sr, title=f"Rolling Sharpe ({int(rolling_window)}d)")
+        st.pyplot(plt.gcf(), clear_figure=True)
+
     st.success("Done.")
 else:
     st.info("Set parameters in the sidebar and click **Run backtest**.")
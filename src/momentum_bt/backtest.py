@@ -4,7 +4,10 @@ from dataclasses import dataclass
 import numpy as np
 import pandas as pd
 
+from momentum_bt.data.panel import OHLCVPanel
 from momentum_bt.features.momentum import compute_momentum
+from momentum_bt.features.volatility import ewma_covariance, ewma_horizon, rolling_volatility
+from momentum_bt.portfolio.sparse import SparseWeights
 from momentum_bt.portfolio.weights import build_long_short_weights
 
 
@@ -16,48 +19,169 @@ class BacktestParams:
     bottom_n: int = 5
     transaction_cost: float = 0.0005  # 5 bps per 1.0 turnover
     gross_exposure: float = 2.0       # 2 = 100% long + 100% short
+    # Liquidity filter / slippage (need an OHLCVPanel with traded value)
+    min_traded_value: float = 0.0     # min rolling avg traded value to be eligible (0 = off)
+    liquidity_window: int = 20        # window of the rolling avg traded value
+    capital: float = 0.0              # portfolio notional for participation slippage (0 = off)
+    impact_coef: float = 0.1          # slippage per 1.0 turnover = impact_coef * sqrt(participation)
+    max_participation: float = 1.0    # participation cap; also charged when avg traded value is 0/unknown
+    sparse_weights: bool = False      # store weights only at rebalances (large universes)
+    # Weighting within each leg: "equal", "inverse_vol" or "risk_parity" (EWMA covariance)
+    weighting: str = "equal"
+    vol_window: int = 60              # rolling volatility window; also min history for risk_parity
+    ewma_halflife: float = 30.0       # EWMA covariance half-life (days) for risk_parity
 
 
-def run_momentum_backtest(prices: pd.DataFrame, params: BacktestParams) -> dict:
+# Above this universe size callers should use sparse_weights=True
+SPARSE_WEIGHTS_MIN_ASSETS = 200
+
+
+def fit_top_bottom(top_n: int, bottom_n: int, n_assets: int) -> tuple[int, int]:
+    """
+    Shrink Top N / Bottom N if both legs do not fit into n_assets instruments
+    (each leg is capped at half of the universe).
+    """
+    if top_n + bottom_n <= n_assets:
+        return top_n, bottom_n
+    max_side = max(1, n_assets // 2)
+    return min(top_n, max_side), min(bottom_n, max_side)
+
+
+def _participation_slippage(abs_trades: np.ndarray, adv: np.ndarray, params: BacktestParams) -> np.ndarray:
+    """
+    Volume-participation slippage per trade: trade of |dw| * capital against
+    avg traded value, participation capped at max_participation. Zero or
+    unknown avg traded value (e.g. shorter history than liquidity_window)
+    is charged at the cap, so illiquid names are never cheaper than liquid ones.
+    """
+    abs_trades = np.nan_to_num(abs_trades, nan=0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        participation = abs_trades * params.capital / adv
+    participation = np.where(
+        np.isfinite(participation), np.minimum(participation, params.max_participation), params.max_participation
+    )
+    return abs_trades * params.impact_coef * np.sqrt(participation)
+
+
+def run_momentum_backtest(
+    prices: pd.DataFrame,
+    params: BacktestParams,
+    universe_mask: pd.DataFrame | None = None,
+    panel: OHLCVPanel | None = None,
+) -> dict:
     """
     Академически корректный backtest:
     - signals computed on day t close
     - weights applied starting day t+1 (shift)
     - transaction costs from turnover of weights (sum(abs(w_t - w_{t-1})))
+
+    universe_mask: optional boolean (date x asset) point-in-time membership
+    (e.g. moex_universe.imoex_membership_mask). Non-members get NaN scores,
+    so they are never selected on that rebalance date.
+
+    panel: optional OHLCVPanel with traded value, required for
+    params.min_traded_value (liquidity filter) and params.capital
+    (volume-participation slippage on top of the flat transaction_cost).
     """
     prices = prices.sort_index()
     returns = prices.pct_change()
 
     scores = compute_momentum(prices, params.lookback)
+    if universe_mask is not None:
+        mask = universe_mask.reindex(index=scores.index, columns=scores.columns, fill_value=False)
+        scores = scores.where(mask.to_numpy(dtype=bool))
+
+    adv = None
+    if params.min_traded_value > 0 or params.capital > 0:
+        if panel is None:
+            raise ValueError("min_traded_value / capital require an OHLCVPanel (panel=...)")
+        # average traded value known at day t close (same timing as the signal)
+        adv = (
+            panel.traded_value.reindex(index=prices.index, columns=prices.columns)
+            .rolling(params.liquidity_window, min_periods=params.liquidity_window)
+            .mean()
+        )
+
+    if params.min_traded_value > 0:
+        scores = scores.where(adv.to_numpy() >= params.min_traded_value)
 
     # choose rebalance dates (every N trading days, after lookback)
     idx = prices.index
     start_i = params.lookback
     rebalance_idx = idx[start_i::params.rebalance_days]
-
-    weights = pd.DataFrame(0.0, index=idx, columns=prices.columns)
-    last_w = pd.Series(0.0, index=prices.columns)
-
-    for t in idx:
-        if t in rebalance_idx:
-            w_t = build_long_short_weights(
-                scores.loc[t],
-                top_n=params.top_n,
-                bottom_n=params.bottom_n,
-                gross_exposure=params.gross_exposure,
-            )
-            # align to full universe columns
-            last_w = pd.Series(0.0, index=prices.columns)
-            last_w.loc[w_t.index] = w_t.values
-
-        weights.loc[t] = last_w.values
-
-    # Strategy return with execution lag (apply weights from t-1 to returns at t)
-    gross_ret = (weights.shift(1) * returns).sum(axis=1)
-
-    # Turnover & costs (weights-based)
-    turnover = weights.diff().abs().sum(axis=1).fillna(0.0)
-    costs = turnover * params.transaction_cost
+    rebalance_pos = np.arange(start_i, len(idx), params.rebalance_days)
+
+    # Rolling volatility for the whole panel, computed once (not per rebalance)
+    vol = None
+    if params.weighting != "equal":
+        vol = rolling_volatility(returns, params.vol_window)
+
+    cov_horizon = ewma_horizon(params.ewma_halflife, params.vol_window)
+
+    def rebalance_weights(k: int) -> pd.Series:
+        i = rebalance_pos[k]
+
+        leg_cov = None
+        if params.weighting == "risk_parity":
+            # covariance of the selected leg assets only, as of day i, from the
+            # last cov_horizon rows (O(horizon x leg) per call, not O(T));
+            # same full-window requirement as the inverse_vol fallback
+            def leg_cov(assets: pd.Index) -> pd.DataFrame | None:
+                window = returns.iloc[max(0, i + 1 - cov_horizon): i + 1]
+                return ewma_covariance(window[assets], params.ewma_halflife, min_periods=params.vol_window)
+
+        return build_long_short_weights(
+            scores.iloc[i],
+            top_n=params.top_n,
+            bottom_n=params.bottom_n,
+            gross_exposure=params.gross_exposure,
+            weighting=params.weighting,
+            vol=vol.iloc[i] if vol is not None else None,
+            leg_cov=leg_cov,
+        )
+
+    if params.sparse_weights:
+        # Only rebalance dates are visited; returns/turnover gather held assets only
+        rows = [rebalance_weights(k) for k in range(len(rebalance_pos))]
+        weights = SparseWeights.from_rows(idx, prices.columns, rebalance_pos, rows)
+
+        gross_ret = pd.Series(weights.gross_returns(returns.to_numpy(dtype=float)), index=idx)
+        turnover = pd.Series(weights.turnover(), index=idx)
+
+        slip = np.zeros(len(idx))
+        if params.capital > 0:
+            adv_arr = adv.to_numpy()
+            for pos, assets, delta in weights.trades():
+                slip[pos] = _participation_slippage(np.abs(delta), adv_arr[pos, assets], params).sum()
+        slippage = pd.Series(slip, index=idx)
+
+    else:
+        weights = pd.DataFrame(0.0, index=idx, columns=prices.columns)
+        last_w = pd.Series(0.0, index=prices.columns)
+
+        rebalance_k = {int(i): k for k, i in enumerate(rebalance_pos)}
+        for i, t in enumerate(idx):
+            if i in rebalance_k:
+                w_t = rebalance_weights(rebalance_k[i])
+                # align to full universe columns
+                last_w = pd.Series(0.0, index=prices.columns)
+                last_w.loc[w_t.index] = w_t.values
+
+            weights.loc[t] = last_w.values
+
+        # Strategy return with execution lag (apply weights from t-1 to returns at t)
+        gross_ret = (weights.shift(1) * returns).sum(axis=1)
+
+        # Turnover (weights-based)
+        trades = weights.diff().abs()
+        turnover = trades.sum(axis=1).fillna(0.0)
+
+        slippage = pd.Series(0.0, index=idx)
+        if params.capital > 0:
+            slip = _participation_slippage(trades.to_numpy(), adv.to_numpy(), params)
+            slippage = pd.Series(slip.sum(axis=1), index=idx)
+
+    costs = turnover * params.transaction_cost + slippage
 
     net_ret = gross_ret - costs
     equity = (1.0 + net_ret.fillna(0.0)).cumprod()
@@ -73,6 +197,7 @@ def run_momentum_backtest(prices: pd.DataFrame, params: BacktestParams) -> dict:
         "weights": weights,
         "turnover": turnover,
         "costs": costs,
+        "slippage": slippage,
         "gross_ret": gross_ret,
         "net_ret": net_ret,
         "equity": equity,
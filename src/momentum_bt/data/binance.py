@@ -8,6 +8,8 @@ from typing import Optional, List, Dict, Any
 import pandas as pd
 import requests
 
+from momentum_bt.data.panel import OHLCVPanel
+
 
 BINANCE_BASE_URL = "https://api.binance.com"
 
@@ -34,7 +36,8 @@ def fetch_klines(req: BinanceKlinesRequest, sleep_s: float = 0.2) -> pd.DataFram
     Fetch OHLCV klines from Binance Spot public API.
 
     Returns DataFrame indexed by UTC datetime with columns:
-    ["open", "high", "low", "close", "volume"].
+    ["open", "high", "low", "close", "volume", "value"]
+    (value = quote asset volume, i.e. traded value in quote currency).
     """
     url = f"{BINANCE_BASE_URL}/api/v3/klines"
     start_ms = _to_millis(req.start)
@@ -73,7 +76,7 @@ def fetch_klines(req: BinanceKlinesRequest, sleep_s: float = 0.2) -> pd.DataFram
             break
 
     if not all_rows:
-        return pd.DataFrame(columns=["open", "high", "low", "close", "volume"])
+        return pd.DataFrame(columns=["open", "high", "low", "close", "volume", "value"])
 
     df = pd.DataFrame(
         all_rows,
@@ -95,10 +98,11 @@ def fetch_klines(req: BinanceKlinesRequest, sleep_s: float = 0.2) -> pd.DataFram
 
     # Types
     df["open_time"] = pd.to_datetime(df["open_time"], unit="ms", utc=True)
-    for c in ["open", "high", "low", "close", "volume"]:
+    df["value"] = df["quote_asset_volume"]
+    for c in ["open", "high", "low", "close", "volume", "value"]:
         df[c] = pd.to_numeric(df[c], errors="coerce")
 
-    df = df.set_index("open_time")[["open", "high", "low", "close", "volume"]].sort_index()
+    df = df.set_index("open_time")[["open", "high", "low", "close", "volume", "value"]].sort_index()
 
     # Drop duplicates just in case
     df = df[~df.index.duplicated(keep="last")]
@@ -106,6 +110,25 @@ def fetch_klines(req: BinanceKlinesRequest, sleep_s: float = 0.2) -> pd.DataFram
     return df
 
 
+def build_ohlcv_panel(
+    symbols: List[str],
+    interval: str,
+    start: datetime,
+    end: datetime,
+    sleep_s: float = 0.2,
+) -> OHLCVPanel:
+    """
+    Download klines for many symbols and keep all fields:
+    OHLCVPanel (field x datetime(UTC) x symbol).
+    """
+    frames: Dict[str, pd.DataFrame] = {}
+    for sym in symbols:
+        req = BinanceKlinesRequest(symbol=sym, interval=interval, start=start, end=end)
+        frames[sym.upper()] = fetch_klines(req, sleep_s=sleep_s)
+
+    return OHLCVPanel.from_asset_frames(frames)
+
+
 def build_close_series(
     symbols: List[str],
     interval: str,
@@ -117,17 +140,8 @@ def build_close_series(
     Download close prices for many symbols and return wide DataFrame:
     index=datetime(UTC), columns=symbol, values=close.
     """
-    closes = []
-    for sym in symbols:
-        req = BinanceKlinesRequest(symbol=sym, interval=interval, start=start, end=end)
-        df = fetch_klines(req, sleep_s=sleep_s)
-        if df.empty:
-            continue
-        s = df["close"].rename(sym.upper())
-        closes.append(s)
-
-    if not closes:
+    panel = build_ohlcv_panel(symbols, interval, start, end, sleep_s=sleep_s)
+    if panel.empty:
         return pd.DataFrame()
 
-    wide = pd.concat(closes, axis=1).sort_index()
-    return wide
+    return panel.close.copy()
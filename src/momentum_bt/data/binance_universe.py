@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+import pandas as pd
+import requests
+
+from momentum_bt.data.binance import BINANCE_BASE_URL
+from momentum_bt.data.cache import cache_dir, read_json, write_json
+
+
+def _get_json(path: str, params: dict | None = None):
+    r = requests.get(f"{BINANCE_BASE_URL}{path}", params=params, timeout=30)
+    r.raise_for_status()
+    return r.json()
+
+
+def _fetch_market_snapshot() -> list[dict]:
+    """
+    One bulk call to exchangeInfo + one to ticker/24hr (all symbols).
+    Returns records: symbol, base_asset, quote_asset, status, quote_volume.
+    """
+    info = _get_json("/api/v3/exchangeInfo")
+    tickers = _get_json("/api/v3/ticker/24hr")
+    quote_volume = {t["symbol"]: float(t.get("quoteVolume") or 0.0) for t in tickers}
+
+    return [
+        {
+            "symbol": s["symbol"],
+            "base_asset": s.get("baseAsset", ""),
+            "quote_asset": s.get("quoteAsset", ""),
+            "status": s.get("status", ""),
+            "quote_volume": quote_volume.get(s["symbol"], 0.0),
+        }
+        for s in info.get("symbols", [])
+    ]
+
+
+def load_binance_market(ttl_s: float = 6 * 60 * 60, cache_path: Path | None = None) -> pd.DataFrame:
+    """
+    Full Binance spot market snapshot (all symbols, unfiltered), cached on disk
+    for `ttl_s` seconds so different filters reuse one download.
+    """
+    if cache_path is None:
+        cache_path = cache_dir() / "binance_market.json"
+
+    cached = read_json(cache_path)
+    if cached and time.time() - cached.get("fetched_at", 0) < ttl_s:
+        records = cached["symbols"]
+    else:
+        records = _fetch_market_snapshot()
+        write_json(cache_path, {"fetched_at": time.time(), "symbols": records})
+
+    return pd.DataFrame(records, columns=["symbol", "base_asset", "quote_asset", "status", "quote_volume"])
+
+
+def load_binance_universe(
+    quote_asset: str = "USDT",
+    min_quote_volume: float = 0.0,
+    top_n: int | None = None,
+    ttl_s: float = 6 * 60 * 60,
+    cache_path: Path | None = None,
+) -> list[str]:
+    """
+    Symbols currently TRADING against `quote_asset`, sorted by 24h quote volume
+    (descending), filtered by min_quote_volume and optionally cut to top_n.
+
+    Note: selection uses *today's* volume; combine with listing_mask so the
+    backtest does not trade symbols before they existed.
+    """
+    df = load_binance_market(ttl_s=ttl_s, cache_path=cache_path)
+    df = df[
+        (df["quote_asset"] == quote_asset.upper())
+        & (df["status"] == "TRADING")
+        & (df["quote_volume"] >= min_quote_volume)
+    ].sort_values("quote_volume", ascending=False)
+
+    if top_n is not None:
+        df = df.head(top_n)
+
+    symbols = df["symbol"].tolist()
+    if not symbols:
+        raise ValueError(f"Binance universe is empty for quote asset {quote_asset!r}")
+
+    return symbols
+
+
+def _fetch_listing_date(symbol: str) -> str | None:
+    """Open time of the first daily kline ("YYYY-MM-DD"), None if no data."""
+    data = _get_json(
+        "/api/v3/klines",
+        {"symbol": symbol.upper(), "interval": "1d", "startTime": 0, "limit": 1},
+    )
+    if not data:
+        return None
+    return pd.Timestamp(data[0][0], unit="ms", tz="UTC").date().isoformat()
+
+
+def load_listing_dates(
+    symbols: list[str],
+    cache_path: Path | None = None,
+    sleep_s: float = 0.1,
+) -> dict[str, str]:
+    """
+    Listing date per symbol, derived from its first kline. Listing dates never
+    change, so they are cached on disk forever and only new symbols are queried.
+    Symbols without klines are not cached and are queried again next time.
+    """
+    if cache_path is None:
+        cache_path = cache_dir() / "binance_listing_dates.json"
+
+    cached = read_json(cache_path) or {}
+    # drop None entries written by older versions so they are re-queried
+    dates: dict[str, str] = {k: v for k, v in cached.items() if v}
+    missing = [s.upper() for s in symbols if s.upper() not in dates]
+
+    fetched = False
+    for sym in missing:
+        listed = _fetch_listing_date(sym)
+        if listed is not None:
+            dates[sym] = listed
+            fetched = True
+        time.sleep(sleep_s)
+
+    if fetched or len(dates) != len(cached):
+        write_json(cache_path, dates)
+
+    return {s.upper(): dates[s.upper()] for s in symbols if s.upper() in dates}
+
+
+def listing_mask(
+    listing_dates: dict[str, str],
+    index: pd.DatetimeIndex,
+    columns: list[str] | pd.Index,
+) -> pd.DataFrame:
+    """
+    Boolean (date x symbol) mask: True from the listing date on.
+    Symbols with unknown listing date are never eligible.
+    """
+    columns = pd.Index(columns)
+    listed = pd.DatetimeIndex(pd.to_datetime([listing_dates.get(c) for c in columns], utc=True))
+    idx = pd.DatetimeIndex(index)
+    idx = idx.tz_localize("UTC") if idx.tz is None else idx.tz_convert("UTC")
+
+    t = idx.normalize().as_unit("ns").asi8[:, None]
+    first = listed.as_unit("ns").asi8[None, :]
+    known = ~listed.isna()[None, :]
+    return pd.DataFrame(known & (t >= first), index=index, columns=columns)
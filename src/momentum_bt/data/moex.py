@@ -3,11 +3,13 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Dict, List
 
 import pandas as pd
 import requests
 
+from momentum_bt.data.panel import OHLCVPanel
+
 
 MOEX_ISS_BASE = "https://iss.moex.com/iss"
 
@@ -77,29 +79,43 @@ def fetch_candles(req: MoexCandlesRequest, sleep_s: float = 0.2) -> pd.DataFrame
     return df
 
 
-def build_close_series(
+def build_ohlcv_panel(
     tickers: List[str],
     start: datetime,
     end: datetime,
     board: str = "TQBR",
     sleep_s: float = 0.2,
-) -> pd.DataFrame:
+) -> OHLCVPanel:
     """
-    Download close prices for many MOEX tickers and return wide DataFrame:
-    index=datetime, columns=ticker, values=close.
+    Download daily candles for many MOEX tickers and keep all fields:
+    OHLCVPanel (field x datetime x ticker), `value` in RUB.
     """
-    closes = []
+    frames: Dict[str, pd.DataFrame] = {}
     for t in tickers:
         req = MoexCandlesRequest(ticker=t, start=start, end=end, board=board)
         df = fetch_candles(req, sleep_s=sleep_s)
         if df.empty or "close" not in df.columns:
             continue
-        s = df["close"].rename(t.upper())
-        closes.append(s)
+        frames[t.upper()] = df
 
-    if not closes:
+    panel = OHLCVPanel.from_asset_frames(frames)
+    panel.index.name = "Date"
+    return panel
+
+
+def build_close_series(
+    tickers: List[str],
+    start: datetime,
+    end: datetime,
+    board: str = "TQBR",
+    sleep_s: float = 0.2,
+) -> pd.DataFrame:
+    """
+    Download close prices for many MOEX tickers and return wide DataFrame:
+    index=datetime, columns=ticker, values=close.
+    """
+    panel = build_ohlcv_panel(tickers, start, end, board=board, sleep_s=sleep_s)
+    if panel.empty:
         return pd.DataFrame()
 
-    wide = pd.concat(closes, axis=1).sort_index()
-    wide.index.name = "Date"
-    return wide
+    return panel.close.copy()
@@ -1,6 +1,15 @@
 from __future__ import annotations
+
+import time
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
 import requests
 
+from momentum_bt.data.cache import cache_dir, read_json, write_json
+
 MOEX_ISS = "https://iss.moex.com/iss"
 
 
@@ -26,10 +35,13 @@ def _find_secid_index(columns: list[str]) -> int | None:
     return None
 
 
-def load_imoex_universe() -> list[str]:
+def _fetch_imoex_constituents(date: str | None = None) -> list[str]:
     """
-    Load IMOEX constituents via MOEX ISS analytics endpoint WITH pagination.
+    Fetch IMOEX constituents via MOEX ISS analytics endpoint WITH pagination.
     MOEX ISS often returns only 20 rows per page by default -> we must iterate start=0,20,40...
+
+    date: "YYYY-MM-DD" to get the index composition on a past date (None = current).
+    May return an empty list (e.g. for a non-trading date).
     """
     url = f"{MOEX_ISS}/statistics/engines/stock/markets/index/analytics/IMOEX.json"
 
@@ -42,6 +54,8 @@ def load_imoex_universe() -> list[str]:
             "iss.only": "analytics,analytics_allowable",
             "start": start,
         }
+        if date is not None:
+            params["date"] = date
         r = requests.get(url, params=params, timeout=30)
         r.raise_for_status()
         js = r.json()
@@ -71,12 +85,97 @@ def load_imoex_universe() -> list[str]:
         if start > 2000:
             break
 
-    tickers = sorted(tickers)
-
     # Filter out the index itself if it appears (sometimes IMOEX can appear as SECID)
-    tickers = [t for t in tickers if t != "IMOEX"]
+    return sorted(t for t in tickers if t != "IMOEX")
+
+
+def load_imoex_universe() -> list[str]:
+    """
+    Load current IMOEX constituents.
+    """
+    tickers = _fetch_imoex_constituents()
 
     if not tickers:
         raise ValueError("IMOEX universe loaded but empty after pagination")
 
     return tickers
+
+
+def _snapshot_dates(start: datetime, end: datetime, freq: str) -> list[str]:
+    """Query dates: the start date itself plus every `freq` date up to end."""
+    first = pd.Timestamp(start).tz_localize(None).normalize()
+    last = pd.Timestamp(end).tz_localize(None).normalize()
+    dates = pd.date_range(first, last, freq=freq)
+    out = {first.date().isoformat()}
+    out.update(d.date().isoformat() for d in dates)
+    return sorted(out)
+
+
+def load_imoex_history(
+    start: datetime,
+    end: datetime,
+    freq: str = "BMS",
+    cache_path: Path | None = None,
+    sleep_s: float = 0.2,
+) -> dict[str, list[str]]:
+    """
+    Load historical IMOEX composition as {"YYYY-MM-DD": [tickers]} snapshots.
+
+    Snapshots are taken at `start` and every `freq` date until `end`
+    (default: first business day of each month) and cached on disk.
+    Only dates missing from the cache are fetched; empty snapshots
+    (non-trading dates) are cached too so they are not re-queried.
+    Today's snapshot is returned but never cached.
+    """
+    if cache_path is None:
+        cache_path = cache_dir() / "imoex_history.json"
+
+    cached = read_json(cache_path) or {}
+    snapshots: dict[str, list[str]] = cached.get("snapshots", {})
+
+    today = datetime.now().date().isoformat()
+    wanted = _snapshot_dates(start, end, freq)
+    # Never query the future; today's snapshot may not be published yet, so it is
+    # fetched but not cached (an empty answer would otherwise stick forever)
+    missing = [d for d in wanted if d not in snapshots and d <= today]
+
+    # `missing` is sorted, so today (if wanted) comes last and is never written
+    for d in missing:
+        snapshots[d] = _fetch_imoex_constituents(d)
+        if d < today:
+            # persist after every date so a failure later keeps what was fetched
+            write_json(cache_path, {"index": "IMOEX", "snapshots": snapshots})
+        time.sleep(sleep_s)
+
+    return {d: snapshots[d] for d in wanted if d in snapshots}
+
+
+def imoex_membership_mask(
+    history: dict[str, list[str]],
+    index: pd.DatetimeIndex,
+    columns: list[str] | pd.Index | None = None,
+) -> pd.DataFrame:
+    """
+    Build a boolean (date x ticker) point-in-time membership mask.
+
+    Each date uses the latest non-empty snapshot taken on or before it
+    (dates before the first snapshot are not members). Vectorized: one
+    searchsorted over snapshot dates and one fancy-index gather.
+    """
+    snaps = sorted((d, t) for d, t in history.items() if t)
+    if columns is None:
+        columns = sorted({t for _, ts in snaps for t in ts})
+    columns = pd.Index(columns)
+
+    snap_dates = pd.DatetimeIndex([d for d, _ in snaps])
+    snap_matrix = np.zeros((len(snaps) + 1, len(columns)), dtype=bool)  # row 0 = "no snapshot yet"
+    for i, (_, ts) in enumerate(snaps, start=1):
+        pos = columns.get_indexer(ts)
+        snap_matrix[i, pos[pos >= 0]] = True
+
+    idx = pd.DatetimeIndex(index)
+    if idx.tz is not None:
+        idx = idx.tz_localize(None)
+    rows = snap_dates.searchsorted(idx.normalize(), side="right")
+
+    return pd.DataFrame(snap_matrix[rows], index=index, columns=columns)
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume", "value")
+
+
+@dataclass(frozen=True, eq=False)
+class OHLCVPanel:
+    """
+    All OHLCV fields for many assets as one contiguous float64 array.
+
+    values: shape (field x date x asset)
+    fields: field names along axis 0 (e.g. "close", "volume", "value")
+    index:  shared DatetimeIndex along axis 1
+    columns: shared asset names along axis 2
+
+    `value` is traded value in quote currency (MOEX `value`, Binance quote
+    asset volume); if a source does not provide it, it is close * volume.
+
+    Panels compare by identity (eq=False: a generated __eq__ over the array
+    field would raise); use np.array_equal on `values` to compare contents.
+    """
+    values: np.ndarray
+    fields: tuple[str, ...]
+    index: pd.DatetimeIndex
+    columns: pd.Index
+
+    def __post_init__(self):
+        expected = (len(self.fields), len(self.index), len(self.columns))
+        if self.values.shape != expected:
+            raise ValueError(f"values shape {self.values.shape} != (fields, dates, assets) {expected}")
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        return self.values.shape
+
+    @property
+    def empty(self) -> bool:
+        return self.values.size == 0
+
+    def field(self, name: str) -> pd.DataFrame:
+        """
+        (date x asset) DataFrame for one field. Backed by a view into `values`
+        (no copy) -- do not modify it in place.
+        """
+        try:
+            i = self.fields.index(name)
+        except ValueError:
+            raise KeyError(f"field {name!r} not in panel fields {self.fields}") from None
+        return pd.DataFrame(self.values[i], index=self.index, columns=self.columns, copy=False)
+
+    @property
+    def close(self) -> pd.DataFrame:
+        return self.field("close")
+
+    @property
+    def traded_value(self) -> pd.DataFrame:
+        return self.field("value")
+
+    def select(self, columns: Sequence[str]) -> "OHLCVPanel":
+        """Subset of assets (copy)."""
+        pos = self.columns.get_indexer(columns)
+        if (pos < 0).any():
+            missing = [c for c, p in zip(columns, pos) if p < 0]
+            raise KeyError(f"assets not in panel: {missing}")
+        return OHLCVPanel(
+            values=np.ascontiguousarray(self.values[:, :, pos]),
+            fields=self.fields,
+            index=self.index,
+            columns=self.columns[pos],
+        )
+
+    @classmethod
+    def from_asset_frames(
+        cls,
+        frames: Dict[str, pd.DataFrame],
+        fields: Sequence[str] = OHLCV_FIELDS,
+    ) -> "OHLCVPanel":
+        """
+        Build a panel from per-asset OHLCV DataFrames (as returned by
+        fetch_klines / fetch_candles). Dates are the sorted union of all
+        asset indexes; missing observations are NaN.
+        """
+        fields = tuple(fields)
+        frames = {k: v for k, v in frames.items() if not v.empty}
+        if not frames:
+            return cls(np.empty((len(fields), 0, 0)), fields, pd.DatetimeIndex([]), pd.Index([]))
+
+        index = frames[next(iter(frames))].index
+        for df in frames.values():
+            index = index.union(df.index)
+        index = index.sort_values()
+        columns = pd.Index(list(frames))
+
+        values = np.full((len(fields), len(index), len(columns)), np.nan)
+        for j, df in enumerate(frames.values()):
+            pos = index.get_indexer(df.index)
+            for i, f in enumerate(fields):
+                if f in df.columns:
+                    values[i, pos, j] = df[f].to_numpy(dtype=float)
+                elif f == "value" and {"close", "volume"} <= set(df.columns):
+                    values[i, pos, j] = (df["close"] * df["volume"]).to_numpy(dtype=float)
+
+        return cls(values, fields, index, columns)
+
+    def save(self, path: str | Path) -> None:
+        """Serialize to a single .npz file (array + index/column metadata; numpy appends .npz if missing)."""
+        tz = str(self.index.tz) if self.index.tz is not None else ""
+        np.savez(
+            path,
+            values=self.values,
+            fields=np.array(self.fields),
+            index=self.index.as_unit("ns").asi8,
+            tz=np.array(tz),
+            index_name=np.array(self.index.name or ""),
+            columns=np.array([str(c) for c in self.columns]),
+        )
+
+    @classmethod
+    def load(cls, path: str | Path) -> "OHLCVPanel":
+        with np.load(path, allow_pickle=False) as npz:
+            tz = str(npz["tz"]) or None
+            index = pd.DatetimeIndex(pd.to_datetime(npz["index"], unit="ns", utc=tz is not None))
+            if tz is not None:
+                index = index.tz_convert(tz)
+            index.name = str(npz["index_name"]) or None
+            return cls(
+                values=np.ascontiguousarray(npz["values"]),
+                fields=tuple(str(f) for f in npz["fields"]),
+                index=index,
+                columns=pd.Index([str(c) for c in npz["columns"]]),
+            )
@@ -0,0 +1,27 @@
+"""
+App defaults shared by app.py (initial sidebar values) and prewarm.py (published
+runs), so a pre-warmed run always matches an untouched sidebar.
+"""
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from momentum_bt.backtest import BacktestParams
+
+
+DEFAULT_START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+DEFAULT_END = datetime(2024, 12, 31, tzinfo=timezone.utc)
+DEFAULT_CRYPTO_SYMBOLS = ("BTCUSDT", "ETHUSDT", "BNBUSDT", "SOLUSDT", "XRPUSDT")
+DEFAULT_BOARD = "TQBR"
+
+# Window (days) of the rolling Sharpe chart
+DEFAULT_ROLLING_WINDOW = 63
+
+APP_DEFAULT_PARAMS = BacktestParams(
+    lookback=60,
+    rebalance_days=21,
+    top_n=10,
+    bottom_n=10,
+    transaction_cost=0.0005,
+    gross_exposure=2.0,
+)
@@ -0,0 +1,42 @@
+"""
+O(N) rolling statistics from cumulative sums (no window-by-window loop).
+Shared by features (per-asset volatility) and metrics (rolling vol / Sharpe).
+"""
+from __future__ import annotations
+
+import numpy as np
+
+
+def rolling_sums(x: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Rolling count / sum / sum of squares over `window` rows, NaN-aware,
+    from one cumulative sum each: S[t] - S[t - window].
+    """
+    valid = ~np.isnan(x)
+    x0 = np.where(valid, x, 0.0)
+    pad = np.zeros((1, x.shape[1]))
+
+    def _win(a: np.ndarray) -> np.ndarray:
+        c = np.concatenate([pad, np.cumsum(a, axis=0)])
+        return c[window:] - c[:-window] if window <= x.shape[0] else c[:0]
+
+    head = min(window - 1, x.shape[0])
+    nan_head = np.full((head, x.shape[1]), np.nan)
+    cnt, s1, s2 = (np.concatenate([nan_head, _win(a)]) for a in (valid.astype(float), x0, x0 ** 2))
+    return cnt, s1, s2
+
+
+def rolling_mean_std(x: np.ndarray, window: int, min_periods: int | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Rolling mean and std (ddof=1) of a (rows x columns) array; NaN where fewer than min_periods values."""
+    if window < 2:
+        raise ValueError("window must be >= 2")
+    min_periods = window if min_periods is None else max(2, min_periods)
+
+    cnt, s1, s2 = rolling_sums(x, window)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = s1 / cnt
+        var = (s2 - cnt * mean ** 2) / (cnt - 1)
+    # cumulative-sum differences can go slightly negative from rounding
+    var = np.where(var < 0, 0.0, var)
+    enough = cnt >= min_periods
+    return np.where(enough, mean, np.nan), np.where(enough, np.sqrt(var), np.nan)
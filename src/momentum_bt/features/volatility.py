@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+
+from momentum_bt.features._rolling import rolling_mean_std
+
+
+def rolling_volatility(returns: pd.DataFrame, window: int) -> pd.DataFrame:
+    """
+    Per-period (not annualized) rolling volatility for the whole panel,
+    computed once with cumulative sums (O(N) per column).
+    """
+    _, std = rolling_mean_std(returns.to_numpy(dtype=float), window)
+    return pd.DataFrame(std, index=returns.index, columns=returns.columns)
+
+
+def ewma_horizon(halflife: float, min_periods: int) -> int:
+    """Rows of history ewma_covariance uses: 20 half-lives (weight < 1e-6) or min_periods, whichever is longer."""
+    return max(int(np.ceil(20 * halflife)), min_periods)
+
+
+def ewma_covariance(returns: pd.DataFrame, halflife: float, min_periods: int) -> pd.DataFrame | None:
+    """
+    EWMA (zero-mean) covariance of the columns of `returns` as of its last row,
+    with weights lam ** (age in rows), lam = 0.5 ** (1 / halflife).
+
+    Meant to be called per rebalance with only the selected assets' columns,
+    so memory is O(leg size ** 2). Only the last ewma_horizon() rows are
+    used, so callers can pass just that tail. NaN returns are skipped: each
+    entry is normalized by the decay weights of the observations both assets
+    have, so short or gappy histories are not biased towards zero.
+
+    Returns None if any asset has fewer than min_periods real observations.
+    """
+    if halflife <= 0:
+        raise ValueError("halflife must be positive")
+
+    r = returns.to_numpy(dtype=float)[-ewma_horizon(halflife, min_periods):]
+    valid = ~np.isnan(r)
+    if (valid.sum(axis=0) < min_periods).any():
+        return None
+
+    lam = 0.5 ** (1.0 / halflife)
+    sqrt_w = np.sqrt(lam ** np.arange(len(r) - 1, -1, -1))[:, None]
+    x = np.where(valid, r, 0.0) * sqrt_w
+    m = valid * sqrt_w
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = (x.T @ x) / (m.T @ m)
+    return pd.DataFrame(cov, index=returns.columns, columns=returns.columns)
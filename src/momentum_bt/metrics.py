@@ -3,6 +3,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from momentum_bt.features._rolling import rolling_mean_std
+
 
 def max_drawdown(equity: pd.Series) -> float:
     peak = equity.cummax()
@@ -36,3 +38,147 @@ def summary_stats(net_ret: pd.Series, equity: pd.Series, periods_per_year: int =
         "Vol(ann.)": float(net_ret.dropna().std() * np.sqrt(periods_per_year)),
         "Mean(ann.)": float(net_ret.dropna().mean() * periods_per_year),
     }
+
+
+# ---------------------------------------------------------------------------
+# Vectorized (date x strategy) metrics
+# ---------------------------------------------------------------------------
+
+def _as_frame(x: pd.Series | pd.DataFrame) -> pd.DataFrame:
+    return x.to_frame() if isinstance(x, pd.Series) else x
+
+
+def _like_input(values: np.ndarray, x: pd.Series | pd.DataFrame) -> pd.Series | pd.DataFrame:
+    if isinstance(x, pd.Series):
+        return pd.Series(values[:, 0], index=x.index, name=x.name)
+    return pd.DataFrame(values, index=x.index, columns=x.columns)
+
+
+def _drawdown_matrix(equity: np.ndarray) -> np.ndarray:
+    peak = np.maximum.accumulate(equity, axis=0)
+    return equity / peak - 1.0
+
+
+def _longest_run(flags: np.ndarray) -> np.ndarray:
+    """
+    Longest run of consecutive True values per column, without a Python loop:
+    running count of True minus the count at the most recent False.
+    """
+    counts = np.cumsum(flags, axis=0)
+    resets = np.maximum.accumulate(np.where(flags, 0, counts), axis=0)
+    return (counts - resets).max(axis=0, initial=0)
+
+
+def summary_stats_matrix(
+    returns: pd.DataFrame,
+    periods_per_year: int = 252,
+    turnover: pd.DataFrame | None = None,
+) -> pd.DataFrame:
+    """
+    Compute summary metrics for every column of a (date x strategy) returns matrix
+    in a few NumPy passes (no loop over strategies).
+
+    Conventions match the single-series functions above:
+    - NaN returns are ignored for mean/std and treated as 0 for the equity curve
+      (same as equity = (1 + net_ret.fillna(0)).cumprod() in the backtest)
+    - std uses ddof=1, CAGR uses (len(equity) - 1) / periods_per_year years
+    - HitRate = share of positive periods among non-zero periods
+    - MaxDDDuration = longest underwater stretch, in periods
+    - all-NaN columns get NaN for every metric
+
+    Returns DataFrame indexed by strategy with one column per metric.
+    """
+    returns = _as_frame(returns)
+    r = returns.to_numpy(dtype=float)
+    valid = ~np.isnan(r)
+    r0 = np.where(valid, r, 0.0)
+    n = valid.sum(axis=0)
+    ann = np.sqrt(periods_per_year)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = r0.sum(axis=0) / n
+        dev = np.where(valid, r0 - mean, 0.0)
+        std = np.sqrt((dev ** 2).sum(axis=0) / (n - 1))
+        std = np.where((n >= 2) & (std > 0), std, np.nan)
+        sharpe = mean / std * ann
+
+        downside = np.sqrt((np.minimum(r0, 0.0) ** 2).sum(axis=0) / n)
+        downside = np.where((n >= 2) & (downside > 0), downside, np.nan)
+        sortino = mean / downside * ann
+
+        equity = np.cumprod(1.0 + r0, axis=0)
+        n_rows = r.shape[0]
+        if n_rows >= 2:
+            years = (n_rows - 1) / periods_per_year
+            cagr_ = (equity[-1] / equity[0]) ** (1.0 / years) - 1.0
+        else:
+            cagr_ = np.full(r.shape[1], np.nan)
+
+        dd = _drawdown_matrix(equity) if n_rows else np.zeros_like(r)
+        max_dd = dd.min(axis=0, initial=0.0)
+        calmar = np.where(max_dd < 0, cagr_ / np.abs(max_dd), np.nan)
+
+        nonzero = (r0 != 0).sum(axis=0)
+        hit_rate = np.where(nonzero > 0, (r0 > 0).sum(axis=0) / nonzero, np.nan)
+
+    out = pd.DataFrame(
+        {
+            "CAGR": cagr_,
+            "Sharpe": sharpe,
+            "Sortino": sortino,
+            "Calmar": calmar,
+            "MaxDD": max_dd,
+            "MaxDDDuration": _longest_run(dd < 0),
+            "HitRate": hit_rate,
+            "Vol(ann.)": std * ann,
+            "Mean(ann.)": mean * periods_per_year,
+        },
+        index=returns.columns,
+    )
+    # a strategy without a single observation has no return path at all
+    out.loc[n == 0] = np.nan
+
+    if turnover is not None:
+        turnover = _as_frame(turnover).reindex(index=returns.index, columns=returns.columns)
+        out["AvgTurnover"] = np.nanmean(turnover.to_numpy(dtype=float), axis=0)
+
+    return out
+
+
+# ---------------------------------------------------------------------------
+# O(N) rolling metrics (cumulative sums, see features._rolling)
+# ---------------------------------------------------------------------------
+
+def rolling_vol(
+    returns: pd.Series | pd.DataFrame,
+    window: int,
+    periods_per_year: int = 252,
+    min_periods: int | None = None,
+) -> pd.Series | pd.DataFrame:
+    """Annualized rolling volatility (ddof=1), computed in O(N) per column."""
+    _, std = rolling_mean_std(_as_frame(returns).to_numpy(dtype=float), window, min_periods)
+    return _like_input(std * np.sqrt(periods_per_year), returns)
+
+
+def rolling_sharpe(
+    returns: pd.Series | pd.DataFrame,
+    window: int,
+    periods_per_year: int = 252,
+    min_periods: int | None = None,
+) -> pd.Series | pd.DataFrame:
+    """Annualized rolling Sharpe ratio (zero risk-free rate), computed in O(N) per column."""
+    mean, std = rolling_mean_std(_as_frame(returns).to_numpy(dtype=float), window, min_periods)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        sr = np.where(std > 0, mean / std, np.nan) * np.sqrt(periods_per_year)
+    return _like_input(sr, returns)
+
+
+def rolling_drawdown(equity: pd.Series | pd.DataFrame, window: int) -> pd.Series | pd.DataFrame:
+    """
+    Drawdown from the running peak within the trailing `window` periods.
+    Uses pandas' rolling max (monotonic-deque, O(N)).
+    """
+    if window < 1:
+        raise ValueError("window must be positive")
+    peak = equity.rolling(window, min_periods=1).max()
+    return equity / peak - 1.0
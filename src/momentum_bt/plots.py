@@ -48,3 +48,17 @@ def plot_turnover(turnover: pd.Series, title: str = "Turnover"):
     plt.xlabel("Date")
     plt.ylabel("Turnover (sum abs weight changes)")
     plt.tight_layout()
+
+
+def plot_rolling_sharpe(rolling_sr: pd.Series, title: str = "Rolling Sharpe"):
+    """
+    Plot a precomputed rolling Sharpe series (see metrics.rolling_sharpe).
+    IMPORTANT: does NOT call plt.show().
+    """
+    plt.figure()
+    rolling_sr.dropna().plot()
+    plt.axhline(0.0, color="grey", linewidth=0.8)
+    plt.title(title)
+    plt.xlabel("Date")
+    plt.ylabel("Sharpe (ann.)")
+    plt.tight_layout()
@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterator, List
+
+import numpy as np
+import pandas as pd
+
+
+def _merge_changes(
+    a_old: np.ndarray, v_old: np.ndarray, a_new: np.ndarray, v_new: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Signed weight change per asset between two holdings sets
+    (union of both asset sets, w_new - w_old).
+    """
+    assets, inv = np.unique(np.concatenate([a_old, a_new]), return_inverse=True)
+    delta = np.bincount(inv, weights=np.concatenate([-v_old, v_new]), minlength=len(assets))
+    return assets, delta
+
+
+@dataclass(frozen=True)
+class SparseWeights:
+    """
+    Piecewise-constant portfolio weights stored only at rebalance dates,
+    CSR-style: holdings of rebalance k are
+    assets[indptr[k]:indptr[k+1]] (column positions) with weights
+    values[indptr[k]:indptr[k+1]], held from index[rebalance_pos[k]]
+    until the next rebalance. Before the first rebalance the book is flat.
+
+    Memory is O(positions held), not O(dates x universe).
+    """
+    index: pd.Index
+    columns: pd.Index
+    rebalance_pos: np.ndarray   # int, increasing positions into index
+    indptr: np.ndarray          # int, len(rebalance_pos) + 1
+    assets: np.ndarray          # int column positions
+    values: np.ndarray          # float weights
+
+    @classmethod
+    def from_rows(
+        cls,
+        index: pd.Index,
+        columns: pd.Index,
+        rebalance_pos: np.ndarray,
+        rows: List[pd.Series],
+    ) -> "SparseWeights":
+        """Build from one weights Series (indexed by asset) per rebalance date; zeros are dropped."""
+        assets, values, indptr = [], [], [0]
+        for w in rows:
+            w = w[w != 0]
+            pos = columns.get_indexer(w.index)
+            if (pos < 0).any():
+                raise KeyError(f"assets not in columns: {list(w.index[pos < 0])}")
+            order = np.argsort(pos)
+            assets.append(pos[order])
+            values.append(w.to_numpy(dtype=float)[order])
+            indptr.append(indptr[-1] + len(w))
+
+        return cls(
+            index=index,
+            columns=columns,
+            rebalance_pos=np.asarray(rebalance_pos, dtype=np.int64),
+            indptr=np.asarray(indptr, dtype=np.int64),
+            assets=np.concatenate(assets).astype(np.int64) if assets else np.empty(0, dtype=np.int64),
+            values=np.concatenate(values) if values else np.empty(0),
+        )
+
+    @property
+    def nnz(self) -> int:
+        return len(self.values)
+
+    def holdings(self, k: int) -> tuple[np.ndarray, np.ndarray]:
+        """(asset positions, weights) of rebalance k."""
+        lo, hi = self.indptr[k], self.indptr[k + 1]
+        return self.assets[lo:hi], self.values[lo:hi]
+
+    def latest(self) -> pd.Series:
+        """Non-zero weights of the last rebalance, indexed by asset name."""
+        if len(self.rebalance_pos) == 0:
+            return pd.Series(dtype=float)
+        a, v = self.holdings(len(self.rebalance_pos) - 1)
+        return pd.Series(v, index=self.columns[a])
+
+    def to_dense(self) -> pd.DataFrame:
+        """Full (date x asset) weights, identical to the dense backtest output."""
+        out = np.zeros((len(self.index), len(self.columns)))
+        ends = np.append(self.rebalance_pos[1:], len(self.index))
+        for k, (lo, hi) in enumerate(zip(self.rebalance_pos, ends)):
+            a, v = self.holdings(k)
+            out[lo:hi, a] = v
+        return pd.DataFrame(out, index=self.index, columns=self.columns)
+
+    def gross_returns(self, returns: np.ndarray) -> np.ndarray:
+        """
+        Portfolio return with one-day execution lag (weights of t-1 on returns of t),
+        gathering only held assets' returns per holding period. NaN returns count as 0.
+        """
+        out = np.zeros(len(self.index))
+        ends = np.append(self.rebalance_pos[1:], len(self.index) - 1)
+        for k, (start, end) in enumerate(zip(self.rebalance_pos, ends)):
+            a, v = self.holdings(k)
+            if len(a) == 0:
+                continue
+            block = returns[start + 1:end + 1, a]
+            out[start + 1:end + 1] = np.where(np.isnan(block), 0.0, block) @ v
+        return out
+
+    def trades(self) -> Iterator[tuple[int, np.ndarray, np.ndarray]]:
+        """Yield (date position, asset positions, signed weight change) per rebalance."""
+        a_old, v_old = np.empty(0, dtype=np.int64), np.empty(0)
+        for k, pos in enumerate(self.rebalance_pos):
+            a_new, v_new = self.holdings(k)
+            assets, delta = _merge_changes(a_old, v_old, a_new, v_new)
+            yield int(pos), assets, delta
+            a_old, v_old = a_new, v_new
+
+    def turnover(self) -> np.ndarray:
+        """sum(abs(w_t - w_{t-1})) per date; non-zero only on rebalance dates."""
+        out = np.zeros(len(self.index))
+        for pos, _, delta in self.trades():
+            out[pos] = np.abs(delta).sum()
+        return out
@@ -1,25 +1,104 @@
 from __future__ import annotations
 
+from typing import Callable
+
 import numpy as np
 import pandas as pd
 
 
+WEIGHTING_SCHEMES = ("equal", "inverse_vol", "risk_parity")
+
+
+def _risk_parity(cov: np.ndarray, n_iter: int = 500, tol: float = 1e-10) -> np.ndarray | None:
+    """
+    Equal-risk-contribution weights (w > 0, sum(w) == 1) for a covariance matrix,
+    by cyclical coordinate descent on the convex problem
+    min 0.5 * x'Cx - sum(log(x)) / n. Each coordinate update is the positive
+    root of a quadratic, so weights stay positive even when an asset is
+    negatively correlated with the rest of its leg.
+
+    Returns None if C is degenerate, the solver does not converge or the
+    result is not finite and positive (caller falls back to inverse_vol).
+    """
+    d = np.diag(cov)
+    if not (np.isfinite(cov).all() and (d > 0).all()):
+        return None
+
+    b = 1.0 / len(d)
+    x = 1.0 / np.sqrt(d)
+    for _ in range(n_iter):
+        x_prev = x.copy()
+        for i in range(len(d)):
+            c = cov[i] @ x - d[i] * x[i]
+            x[i] = (-c + np.sqrt(c * c + 4.0 * d[i] * b)) / (2.0 * d[i])
+        if np.abs(x - x_prev).max() <= tol * np.abs(x).max():
+            break
+    else:
+        return None
+
+    w = x / x.sum()
+    if not (np.isfinite(w).all() and (w > 0).all()):
+        return None
+    return w
+
+
+def _leg_weights(
+    assets: pd.Index,
+    weighting: str,
+    vol: pd.Series | None,
+    leg_cov: Callable[[pd.Index], pd.DataFrame | None] | None,
+) -> np.ndarray:
+    """
+    Positive weights summing to 1 within one leg.
+    Falls back to the next simpler scheme if estimates are missing or degenerate
+    (risk_parity -> inverse_vol -> equal).
+    """
+    n = len(assets)
+    if weighting == "risk_parity" and leg_cov is not None:
+        cov = leg_cov(assets)
+        if cov is not None:
+            w = _risk_parity(cov.reindex(index=assets, columns=assets).to_numpy(dtype=float))
+            if w is not None:
+                return w
+
+    if weighting in ("inverse_vol", "risk_parity") and vol is not None:
+        v = vol.reindex(assets).to_numpy(dtype=float)
+        if np.isfinite(v).all() and (v > 0).all():
+            return (1.0 / v) / (1.0 / v).sum()
+
+    return np.full(n, 1.0 / n)
+
+
 def build_long_short_weights(
     scores: pd.Series,
     top_n: int,
     bottom_n: int,
     gross_exposure: float = 2.0,
+    weighting: str = "equal",
+    vol: pd.Series | None = None,
+    leg_cov: Callable[[pd.Index], pd.DataFrame | None] | None = None,
 ) -> pd.Series:
     """
     Build market-neutral long/short weights from a cross-section of scores.
 
-    - Long top_n assets equally
-    - Short bottom_n assets equally
+    - Long top_n assets, short bottom_n assets
+    - Within each leg (each leg sums to 1 before normalization, so the
+      split of gross exposure between legs does not depend on weighting):
+        "equal"       -> 1 / n
+        "inverse_vol" -> proportional to 1 / vol (equal standalone risk per position)
+        "risk_parity" -> equal risk contribution under leg_cov(leg assets)
     - Normalizes weights so that sum(abs(w)) == gross_exposure
       (gross_exposure=2 -> classic 100% long + 100% short)
 
     scores: Series indexed by asset, higher = stronger momentum
+    vol: per-asset volatility on the rebalance date (for inverse_vol / risk_parity)
+    leg_cov: returns the covariance of the given leg assets on the rebalance
+      date, or None if it cannot be estimated (for risk_parity); only the
+      selected assets are ever requested
     """
+    if weighting not in WEIGHTING_SCHEMES:
+        raise ValueError(f"weighting must be one of {WEIGHTING_SCHEMES}, got {weighting!r}")
+
     s = scores.dropna()
     if len(s) == 0:
         return pd.Series(dtype=float)
@@ -37,9 +116,9 @@ def build_long_short_weights(
     w = pd.Series(0.0, index=s.index)
 
     if top_n > 0:
-        w.loc[longs] = 1.0 / top_n
+        w.loc[longs] = _leg_weights(longs, weighting, vol, leg_cov)
     if bottom_n > 0:
-        w.loc[shorts] = -1.0 / bottom_n
+        w.loc[shorts] = -_leg_weights(shorts, weighting, vol, leg_cov)
 
     # Normalize to desired gross exposure
     gross = float(np.abs(w).sum())
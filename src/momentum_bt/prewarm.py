@@ -0,0 +1,255 @@
+"""
+Cache pre-warming for the deployed Streamlit app.
+
+Refreshes universe + price data for the default app configurations, runs the
+default-parameter backtest and publishes everything to
+<cache dir>/published/<name>/ (panel.npz, result.pkl, meta.json).
+app.py reads published data first and only downloads on a miss.
+
+Usage:
+    python -m momentum_bt.prewarm --once            # e.g. from a systemd timer
+    python -m momentum_bt.prewarm --interval 21600  # long-lived process
+    python -m momentum_bt.prewarm --status          # freshness / warm-up duration
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+import traceback
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from pathlib import Path
+
+import pandas as pd
+
+from momentum_bt.backtest import (
+    BacktestParams,
+    SPARSE_WEIGHTS_MIN_ASSETS,
+    fit_top_bottom,
+    run_momentum_backtest,
+)
+from momentum_bt.data.binance import build_ohlcv_panel as build_crypto_panel
+from momentum_bt.data.cache import cache_dir, read_json, write_json
+from momentum_bt.data.moex import build_ohlcv_panel as build_moex_panel
+from momentum_bt.data.moex_universe import imoex_membership_mask, load_imoex_history, load_imoex_universe
+from momentum_bt.data.panel import OHLCVPanel
+from momentum_bt.defaults import APP_DEFAULT_PARAMS, DEFAULT_BOARD, DEFAULT_CRYPTO_SYMBOLS, DEFAULT_END, DEFAULT_START
+
+
+# Published data older than this is ignored by the app (daily schedule + margin)
+DEFAULT_MAX_AGE_S = 26 * 60 * 60
+
+
+@dataclass(frozen=True)
+class PrewarmConfig:
+    name: str
+    market: str                     # "crypto" or "moex"
+    symbols: tuple[str, ...] = ()   # crypto symbols / MOEX tickers; empty MOEX = IMOEX point-in-time
+    start: datetime = DEFAULT_START
+    end: datetime = DEFAULT_END
+    board: str = DEFAULT_BOARD
+    # requested params; top/bottom are auto-adjusted to the universe like in the app
+    params: BacktestParams = APP_DEFAULT_PARAMS
+
+
+DEFAULT_CONFIGS = (
+    PrewarmConfig("crypto", "crypto", DEFAULT_CRYPTO_SYMBOLS),
+    PrewarmConfig("imoex", "moex"),
+)
+
+
+@dataclass
+class PublishedRun:
+    meta: dict
+    panel: OHLCVPanel
+    result: dict
+
+    @property
+    def age_s(self) -> float:
+        return time.time() - self.meta["refreshed_at"]
+
+    def matches_data(self, symbols, start: datetime, end: datetime, board: str = "TQBR") -> bool:
+        m = self.meta
+        return (
+            m["symbols"] == list(symbols)
+            and m["start"] == start.isoformat()
+            and m["end"] == end.isoformat()
+            and (m["market"] == "crypto" or m["board"] == board)
+        )
+
+    def matches_run(self, params: BacktestParams, universe_mask: str | None) -> bool:
+        return self.meta["params"] == asdict(params) and self.meta["universe_mask"] == universe_mask
+
+
+def published_dir() -> Path:
+    root = os.environ.get("MOMENTUM_BT_PUBLISH_DIR")
+    path = Path(root).expanduser() if root else cache_dir() / "published"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _publish(name: str, panel: OHLCVPanel, result: dict, meta: dict) -> None:
+    """Write panel/result first and meta.json last, each atomically, so readers see complete runs."""
+    d = published_dir() / name
+    d.mkdir(parents=True, exist_ok=True)
+
+    tmp = d / "panel.tmp.npz"
+    panel.save(tmp)
+    os.replace(tmp, d / "panel.npz")
+
+    tmp = d / "result.tmp.pkl"
+    pd.to_pickle(result, tmp)
+    os.replace(tmp, d / "result.pkl")
+
+    write_json(d / "meta.json", meta)
+
+
+def load_published(name: str, max_age_s: float = DEFAULT_MAX_AGE_S) -> PublishedRun | None:
+    """Published run for `name`, or None if missing, unreadable or older than max_age_s."""
+    d = published_dir() / name
+    meta = read_json(d / "meta.json")
+    if not meta or time.time() - meta.get("refreshed_at", 0) > max_age_s:
+        return None
+    try:
+        return PublishedRun(meta=meta, panel=OHLCVPanel.load(d / "panel.npz"), result=pd.read_pickle(d / "result.pkl"))
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+
+
+def prewarm(config: PrewarmConfig) -> dict:
+    """Refresh data for one config, run its default backtest and publish it. Returns meta."""
+    t0 = time.monotonic()
+    meta: dict = {}
+
+    if config.market == "crypto":
+        symbols = [s.upper() for s in config.symbols]
+        panel = build_crypto_panel(symbols=symbols, interval="1d", start=config.start, end=config.end)
+    elif config.market == "moex":
+        meta["current_universe"] = load_imoex_universe()
+        if config.symbols:
+            symbols = [t.upper() for t in config.symbols]
+        else:
+            history = load_imoex_history(config.start, config.end)
+            meta["imoex_history"] = history
+            symbols = sorted({t for ts in history.values() for t in ts})
+        panel = build_moex_panel(tickers=symbols, start=config.start, end=config.end, board=config.board)
+    else:
+        raise ValueError(f"unknown market: {config.market!r}")
+
+    if panel.empty:
+        raise ValueError(f"no price data for {config.name}")
+
+    prices = panel.close.dropna(axis=1, how="all")
+    n_assets = prices.shape[1]
+    top_n, bottom_n = fit_top_bottom(config.params.top_n, config.params.bottom_n, n_assets)
+    params = replace(
+        config.params,
+        top_n=top_n,
+        bottom_n=bottom_n,
+        sparse_weights=n_assets > SPARSE_WEIGHTS_MIN_ASSETS,
+    )
+
+    universe_mask = None
+    if "imoex_history" in meta:
+        universe_mask = imoex_membership_mask(meta["imoex_history"], prices.index, prices.columns)
+
+    result = run_momentum_backtest(prices, params, universe_mask=universe_mask, panel=panel)
+
+    meta.update(
+        name=config.name,
+        market=config.market,
+        symbols=symbols,
+        start=config.start.isoformat(),
+        end=config.end.isoformat(),
+        board=config.board,
+        params=asdict(params),
+        universe_mask="imoex_pit" if universe_mask is not None else None,
+        n_assets=n_assets,
+        n_dates=prices.shape[0],
+        refreshed_at=time.time(),
+        duration_s=time.monotonic() - t0,
+    )
+    _publish(config.name, panel, result, meta)
+    return meta
+
+
+def run_all(configs=DEFAULT_CONFIGS) -> bool:
+    """Pre-warm every config, record per-config status; True if all succeeded."""
+    status_path = published_dir() / "status.json"
+    status = read_json(status_path) or {}
+    ok = True
+
+    for cfg in configs:
+        t0 = time.monotonic()
+        entry = {"attempted_at": time.time()}
+        try:
+            meta = prewarm(cfg)
+            entry.update(
+                ok=True,
+                refreshed_at=meta["refreshed_at"],
+                duration_s=meta["duration_s"],
+                n_assets=meta["n_assets"],
+                n_dates=meta["n_dates"],
+            )
+            print(f"[prewarm] {cfg.name}: {meta['n_assets']} assets in {meta['duration_s']:.1f}s", flush=True)
+        except Exception as e:
+            ok = False
+            # keep the last successful refresh time so staleness stays visible
+            prev = status.get(cfg.name, {})
+            entry.update(
+                ok=False,
+                refreshed_at=prev.get("refreshed_at"),
+                duration_s=time.monotonic() - t0,
+                error=f"{type(e).__name__}: {e}",
+            )
+            print(f"[prewarm] {cfg.name} FAILED: {entry['error']}", file=sys.stderr, flush=True)
+            traceback.print_exc()
+        status[cfg.name] = entry
+        write_json(status_path, status)
+
+    return ok
+
+
+def format_status(now: float | None = None) -> str:
+    """One line per config: last refresh age, warm-up duration, last error."""
+    now = time.time() if now is None else now
+    status = read_json(published_dir() / "status.json") or {}
+    if not status:
+        return "no pre-warm runs recorded"
+
+    lines = []
+    for name, e in sorted(status.items()):
+        refreshed = e.get("refreshed_at")
+        age = f"{(now - refreshed) / 3600:.1f}h ago" if refreshed else "never"
+        line = f"{name:8s} {'ok' if e.get('ok') else 'FAILED':6s} refreshed {age}, took {e.get('duration_s', 0):.1f}s"
+        if e.get("error"):
+            line += f" ({e['error']})"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Pre-warm app caches for the default configurations.")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--once", action="store_true", help="refresh once and exit (default)")
+    mode.add_argument("--interval", type=float, help="refresh every N seconds (long-lived process)")
+    mode.add_argument("--status", action="store_true", help="print freshness and warm-up duration")
+    args = parser.parse_args(argv)
+
+    if args.status:
+        print(format_status())
+        return 0
+
+    if args.interval:
+        while True:
+            t0 = time.monotonic()
+            run_all()
+            time.sleep(max(0.0, args.interval - (time.monotonic() - t0)))
+
+    return 0 if run_all() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# src layout without an installed package: make `momentum_bt` importable
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+
+@pytest.fixture
+def random_prices() -> pd.DataFrame:
+    """Random-walk closes for 30 assets with different vols and a late listing."""
+    rng = np.random.default_rng(42)
+    n_dates, n_assets = 400, 30
+    vols = rng.uniform(0.01, 0.05, n_assets)
+    rets = rng.normal(0.0, 1.0, (n_dates, n_assets)) * vols
+    prices = pd.DataFrame(
+        np.exp(np.cumsum(rets, axis=0)),
+        index=pd.date_range("2022-01-01", periods=n_dates),
+        columns=[f"A{i:02d}" for i in range(n_assets)],
+    )
+    prices.iloc[:150, 3] = np.nan  # listed later
+    prices.iloc[200:210, 7] = np.nan  # suspended
+    return prices
@@ -0,0 +1,17 @@
+import numpy as np
+import pandas as pd
+
+from momentum_bt.backtest import BacktestParams, _participation_slippage
+
+
+def test_participation_slippage_charges_illiquid_at_cap():
+    params = BacktestParams(capital=1e6, impact_coef=0.1, max_participation=1.0)
+    trades = np.array([[0.5, 0.5, 0.5, 0.0, np.nan]])
+    adv = np.array([[1e9, 0.0, np.nan, 0.0, 1e3]])
+
+    slip = _participation_slippage(trades, adv, params)[0]
+
+    capped = 0.5 * 0.1 * np.sqrt(1.0)
+    assert slip[0] < capped                    # liquid: small participation
+    assert slip[1] == slip[2] == capped        # zero / unknown traded value: charged at the cap
+    assert slip[3] == slip[4] == 0.0           # no trade, no cost
@@ -0,0 +1,106 @@
+import time
+
+import pandas as pd
+import pytest
+
+from momentum_bt.data import binance_universe
+from momentum_bt.data.binance_universe import (
+    listing_mask,
+    load_binance_market,
+    load_binance_universe,
+    load_listing_dates,
+)
+from momentum_bt.data.cache import read_json, write_json
+
+SYMBOLS = [
+    # symbol, base, quote, status, 24h quote volume
+    ("BTCUSDT", "BTC", "USDT", "TRADING", 9e9),
+    ("ETHUSDT", "ETH", "USDT", "TRADING", 5e9),
+    ("DOGEUSDT", "DOGE", "USDT", "TRADING", 1e6),
+    ("LUNAUSDT", "LUNA", "USDT", "BREAK", 8e9),
+    ("ETHBTC", "ETH", "BTC", "TRADING", 7e9),
+]
+
+
+@pytest.fixture
+def api(monkeypatch):
+    """Fake Binance REST API; records requested paths."""
+    calls = []
+
+    def fake_get_json(path, params=None):
+        calls.append(path)
+        if path == "/api/v3/exchangeInfo":
+            return {"symbols": [
+                {"symbol": s, "baseAsset": b, "quoteAsset": q, "status": st} for s, b, q, st, _ in SYMBOLS
+            ]}
+        if path == "/api/v3/ticker/24hr":
+            return [{"symbol": s, "quoteVolume": str(v)} for s, *_, v in SYMBOLS]
+        raise AssertionError(f"unexpected path {path}")
+
+    monkeypatch.setattr(binance_universe, "_get_json", fake_get_json)
+    return calls
+
+
+def test_market_snapshot_cached_with_ttl(tmp_path, api):
+    cache = tmp_path / "market.json"
+
+    df = load_binance_market(ttl_s=3600, cache_path=cache)
+    assert len(df) == len(SYMBOLS) and len(api) == 2  # one bulk call each
+
+    load_binance_market(ttl_s=3600, cache_path=cache)
+    assert len(api) == 2  # served from disk
+
+    stale = read_json(cache)
+    stale["fetched_at"] = time.time() - 7200
+    write_json(cache, stale)
+    load_binance_market(ttl_s=3600, cache_path=cache)
+    assert len(api) == 4  # expired -> refetched
+
+
+def test_universe_filters_and_top_n(tmp_path, api):
+    cache = tmp_path / "market.json"
+
+    assert load_binance_universe(cache_path=cache) == ["BTCUSDT", "ETHUSDT", "DOGEUSDT"]
+    assert load_binance_universe(min_quote_volume=1e9, cache_path=cache) == ["BTCUSDT", "ETHUSDT"]
+    assert load_binance_universe(top_n=1, cache_path=cache) == ["BTCUSDT"]
+    assert load_binance_universe(quote_asset="btc", cache_path=cache) == ["ETHBTC"]
+    with pytest.raises(ValueError):
+        load_binance_universe(quote_asset="EUR", cache_path=cache)
+
+
+def test_listing_dates_cached_and_missing_requeried(tmp_path, monkeypatch):
+    cache = tmp_path / "listing.json"
+    calls = []
+
+    def fake_listing(symbol):
+        calls.append(symbol)
+        return None if symbol == "NEWUSDT" else "2020-01-01"
+
+    monkeypatch.setattr(binance_universe, "_fetch_listing_date", fake_listing)
+
+    assert load_listing_dates(["btcusdt", "NEWUSDT"], cache_path=cache, sleep_s=0) == {"BTCUSDT": "2020-01-01"}
+    assert read_json(cache) == {"BTCUSDT": "2020-01-01"}  # None is not written
+
+    load_listing_dates(["BTCUSDT", "NEWUSDT"], cache_path=cache, sleep_s=0)
+    assert calls == ["BTCUSDT", "NEWUSDT", "NEWUSDT"]  # only the missing one re-queried
+
+
+def test_listing_dates_drop_legacy_none_entries(tmp_path, monkeypatch):
+    cache = tmp_path / "listing.json"
+    write_json(cache, {"BTCUSDT": "2020-01-01", "NEWUSDT": None})
+    monkeypatch.setattr(binance_universe, "_fetch_listing_date", lambda s: "2024-06-01")
+
+    assert load_listing_dates(["NEWUSDT"], cache_path=cache, sleep_s=0) == {"NEWUSDT": "2024-06-01"}
+    assert read_json(cache) == {"BTCUSDT": "2020-01-01", "NEWUSDT": "2024-06-01"}
+
+
+@pytest.mark.parametrize("tz", [None, "UTC"])
+def test_listing_mask(tz):
+    index = pd.date_range("2022-01-01", periods=5, tz=tz)
+
+    mask = listing_mask({"A": "2022-01-03", "B": "2020-01-01"}, index, ["A", "B", "UNKNOWN"])
+
+    assert mask.index.equals(index)
+    assert mask["A"].tolist() == [False, False, True, True, True]
+    assert mask["B"].all()
+    assert not mask["UNKNOWN"].any()
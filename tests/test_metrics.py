@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_bt.metrics import (
+    rolling_drawdown,
+    rolling_sharpe,
+    rolling_vol,
+    summary_stats,
+    summary_stats_matrix,
+)
+
+
+@pytest.fixture
+def strategy_returns() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    rets = pd.DataFrame(
+        rng.normal(0.0005, 0.02, (500, 4)),
+        index=pd.date_range("2020-01-01", periods=500),
+        columns=["s1", "s2", "s3", "s4"],
+    )
+    rets.iloc[0] = np.nan
+    rets.iloc[10:15, 1] = np.nan
+    return rets
+
+
+def test_summary_stats_matrix_matches_single_series(strategy_returns):
+    matrix = summary_stats_matrix(strategy_returns, periods_per_year=365)
+
+    for col in strategy_returns.columns:
+        r = strategy_returns[col]
+        equity = (1.0 + r.fillna(0.0)).cumprod()
+        single = summary_stats(r, equity, periods_per_year=365)
+        for key, value in single.items():
+            assert matrix.loc[col, key] == pytest.approx(value, rel=1e-10), (col, key)
+
+
+def test_summary_stats_matrix_turnover_column(strategy_returns):
+    turnover = pd.DataFrame(0.5, index=strategy_returns.index, columns=strategy_returns.columns)
+    matrix = summary_stats_matrix(strategy_returns, turnover=turnover)
+    assert np.allclose(matrix["AvgTurnover"], 0.5)
+
+
+def test_rolling_metrics_match_pandas(strategy_returns):
+    window = 60
+    expected_vol = strategy_returns.rolling(window).std() * np.sqrt(252)
+    expected_sr = strategy_returns.rolling(window).mean() / strategy_returns.rolling(window).std() * np.sqrt(252)
+
+    pd.testing.assert_frame_equal(rolling_vol(strategy_returns, window), expected_vol, rtol=1e-8)
+    pd.testing.assert_frame_equal(rolling_sharpe(strategy_returns, window), expected_sr, rtol=1e-8)
+
+
+# Hand-built path: equity 1.1, 1.045, 0.99275, 1.1913, 1.1913, 1.07217
+HAND_RETURNS = [0.1, -0.05, -0.05, 0.2, 0.0, -0.1]
+
+
+def test_summary_stats_matrix_closed_form():
+    r = np.array(HAND_RETURNS)
+    stats = summary_stats_matrix(pd.DataFrame({"s": r}), periods_per_year=252).loc["s"]
+
+    mean = r.mean()
+    downside = np.sqrt((np.minimum(r, 0.0) ** 2).mean())
+    equity = np.cumprod(1.0 + r)
+    cagr = (equity[-1] / equity[0]) ** (252 / 5) - 1.0
+
+    assert stats["Sortino"] == pytest.approx(mean / downside * np.sqrt(252))
+    assert stats["MaxDD"] == pytest.approx(-0.1)  # 1.1913 -> 1.07217
+    assert stats["CAGR"] == pytest.approx(cagr)
+    assert stats["Calmar"] == pytest.approx(cagr / 0.1)
+    assert stats["MaxDDDuration"] == 2  # underwater on rows 1-2, then only row 5
+    assert stats["HitRate"] == pytest.approx(2 / 5)  # zero return is not counted
+
+
+def test_summary_stats_matrix_no_drawdown_and_no_losses():
+    stats = summary_stats_matrix(pd.DataFrame({"s": [0.01, 0.02, 0.0, 0.01]})).loc["s"]
+
+    assert stats["MaxDD"] == 0.0
+    assert stats["MaxDDDuration"] == 0
+    assert np.isnan(stats["Calmar"])
+    assert np.isnan(stats["Sortino"])
+    assert stats["HitRate"] == 1.0
+
+
+def test_summary_stats_matrix_all_nan_column_and_single_row():
+    rets = pd.DataFrame({"s": HAND_RETURNS, "empty": [np.nan] * 6})
+
+    stats = summary_stats_matrix(rets)
+    assert stats.loc["empty"].isna().all()
+    assert stats.loc["s"].notna().all()
+
+    one_row = summary_stats_matrix(rets.iloc[:1])
+    for key in ("CAGR", "Sharpe", "Sortino", "Vol(ann.)"):
+        assert np.isnan(one_row.loc["s", key])
+    assert one_row.loc["s", "MaxDD"] == 0.0
+
+
+def test_rolling_metrics_window_longer_than_series():
+    rets = pd.DataFrame({"s": HAND_RETURNS})
+
+    vol = rolling_vol(rets, window=10)
+    assert vol.shape == rets.shape and vol.isna().all().all()
+    sr = rolling_sharpe(rets["s"], window=10)
+    assert isinstance(sr, pd.Series) and sr.isna().all()
+
+
+def test_rolling_drawdown_closed_form():
+    equity = pd.Series([1.0, 2.0, 1.5, 1.0, 3.0, 2.0])
+
+    dd = rolling_drawdown(equity, window=2)
+
+    # peak over the last 2 points: 1, 2, 2, 1.5, 3, 3
+    expected = pd.Series([0.0, 0.0, -0.25, -1 / 3, 0.0, -1 / 3])
+    pd.testing.assert_series_equal(dd, expected)
+    # window >= len: plain running-peak drawdown
+    pd.testing.assert_series_equal(rolling_drawdown(equity, window=10), equity / equity.cummax() - 1.0)
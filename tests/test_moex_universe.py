@@ -0,0 +1,95 @@
+from datetime import datetime
+
+import pandas as pd
+import pytest
+
+from momentum_bt.data import moex_universe
+from momentum_bt.data.cache import read_json
+from momentum_bt.data.moex_universe import imoex_membership_mask, load_imoex_history
+
+
+@pytest.fixture
+def fetched(monkeypatch):
+    """Record queried dates; every snapshot is ["SBER", <date>]."""
+    calls = []
+
+    def fake_fetch(date=None):
+        calls.append(date)
+        return ["SBER", f"T{date}"]
+
+    monkeypatch.setattr(moex_universe, "_fetch_imoex_constituents", fake_fetch)
+    return calls
+
+
+def test_refresh_fetches_only_new_dates(tmp_path, fetched):
+    cache = tmp_path / "imoex.json"
+
+    first = load_imoex_history(datetime(2024, 1, 1), datetime(2024, 3, 1), cache_path=cache, sleep_s=0)
+    assert fetched == ["2024-01-01", "2024-02-01", "2024-03-01"]
+    assert list(first) == fetched
+
+    fetched.clear()
+    second = load_imoex_history(datetime(2024, 1, 1), datetime(2024, 5, 1), cache_path=cache, sleep_s=0)
+    assert fetched == ["2024-04-01", "2024-05-01"]
+    assert list(second) == ["2024-01-01", "2024-02-01", "2024-03-01", "2024-04-01", "2024-05-01"]
+    assert set(read_json(cache)["snapshots"]) == set(second)
+
+
+def test_today_is_returned_but_not_cached(tmp_path, fetched):
+    cache = tmp_path / "imoex.json"
+    today = datetime.now()
+
+    history = load_imoex_history(today, today, cache_path=cache, sleep_s=0)
+
+    assert list(history) == [today.date().isoformat()]
+    assert read_json(cache) is None
+
+    # queried again on the next call instead of sticking
+    load_imoex_history(today, today, cache_path=cache, sleep_s=0)
+    assert fetched == [today.date().isoformat()] * 2
+
+
+def test_failure_midway_keeps_fetched_snapshots(tmp_path, monkeypatch):
+    cache = tmp_path / "imoex.json"
+
+    def flaky(date=None):
+        if date == "2024-03-01":
+            raise ConnectionError("ISS down")
+        return ["SBER"]
+
+    monkeypatch.setattr(moex_universe, "_fetch_imoex_constituents", flaky)
+    with pytest.raises(ConnectionError):
+        load_imoex_history(datetime(2024, 1, 1), datetime(2024, 4, 1), cache_path=cache, sleep_s=0)
+
+    assert sorted(read_json(cache)["snapshots"]) == ["2024-01-01", "2024-02-01"]
+
+
+def test_membership_mask_carries_snapshots_forward():
+    history = {
+        "2022-01-05": ["A", "B"],
+        "2022-02-01": ["B", "C"],
+        "2022-03-01": [],  # non-trading date: previous snapshot carries forward
+    }
+    index = pd.date_range("2022-01-01", "2022-03-10")
+
+    mask = imoex_membership_mask(history, index, ["A", "B", "C", "D"])
+
+    assert mask.dtypes.eq(bool).all()
+    assert not mask.loc[:"2022-01-04"].any().any()  # before the first snapshot
+    assert mask.loc["2022-01-05"].tolist() == [True, True, False, False]
+    assert mask.loc["2022-01-31"].tolist() == [True, True, False, False]
+    assert mask.loc["2022-02-01"].tolist() == [False, True, True, False]
+    assert mask.loc["2022-03-10"].tolist() == [False, True, True, False]
+
+
+def test_membership_mask_tz_aware_index_and_default_columns():
+    history = {"2022-01-05": ["A"], "2022-02-01": ["B"]}
+    index = pd.date_range("2022-01-04", periods=40, freq="D", tz="UTC")
+
+    mask = imoex_membership_mask(history, index)
+
+    assert list(mask.columns) == ["A", "B"]
+    assert mask.index.equals(index)
+    assert not mask.loc["2022-01-04", "A"]
+    assert mask.loc["2022-01-05", "A"]
+    assert mask.loc["2022-02-01"].tolist() == [False, True]
@@ -0,0 +1,114 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_bt.backtest import BacktestParams, run_momentum_backtest
+from momentum_bt.data.panel import OHLCVPanel
+
+
+@pytest.fixture
+def frames():
+    idx = pd.date_range("2024-01-01", periods=4, tz="UTC")
+    a = pd.DataFrame(
+        {"open": 1.0, "high": 2.0, "low": 0.5, "close": [1.0, 2.0, 3.0, 4.0],
+         "volume": 10.0, "value": [5.0, 6.0, 7.0, 8.0]},
+        index=idx,
+    )
+    # B starts later and has no `value` column
+    b = pd.DataFrame({"close": [10.0, 20.0], "volume": [3.0, 4.0]}, index=idx[2:] + pd.Timedelta(days=1))
+    return {"A": a, "B": b}
+
+
+def test_from_asset_frames_union_and_nan_fill(frames):
+    panel = OHLCVPanel.from_asset_frames(frames)
+
+    assert panel.shape == (6, 5, 2)
+    assert panel.values.flags["C_CONTIGUOUS"]
+    assert list(panel.columns) == ["A", "B"]
+    assert panel.index.equals(pd.date_range("2024-01-01", periods=5, tz="UTC"))
+
+    close = panel.close
+    assert close["A"].tolist()[:4] == [1.0, 2.0, 3.0, 4.0] and np.isnan(close["A"].iloc[4])
+    assert close["B"].isna().tolist() == [True, True, True, False, False]
+    assert panel.field("open")["B"].isna().all()  # missing field stays NaN
+
+
+def test_value_falls_back_to_close_times_volume(frames):
+    value = OHLCVPanel.from_asset_frames(frames).traded_value
+
+    assert value["A"].tolist()[:4] == [5.0, 6.0, 7.0, 8.0]  # provided value wins
+    assert value["B"].dropna().tolist() == [30.0, 80.0]
+
+
+def test_field_is_a_view_and_unknown_field_raises(frames):
+    panel = OHLCVPanel.from_asset_frames(frames)
+
+    assert np.shares_memory(panel.close.to_numpy(), panel.values)
+    with pytest.raises(KeyError):
+        panel.field("vwap")
+
+
+def test_select_subset_and_unknown_asset(frames):
+    panel = OHLCVPanel.from_asset_frames(frames)
+
+    sub = panel.select(["B"])
+    assert list(sub.columns) == ["B"] and sub.shape == (6, 5, 1)
+    np.testing.assert_array_equal(sub.values[:, :, 0], panel.values[:, :, 1])
+    with pytest.raises(KeyError, match="XYZ"):
+        panel.select(["A", "XYZ"])
+
+
+def test_save_load_round_trip(tmp_path, frames):
+    panel = OHLCVPanel.from_asset_frames(frames)
+    panel.index.name = "Date"
+    panel.save(tmp_path / "p.npz")
+
+    loaded = OHLCVPanel.load(tmp_path / "p.npz")
+
+    assert loaded.index.equals(panel.index)
+    assert str(loaded.index.tz) == "UTC" and loaded.index.name == "Date"
+    assert list(loaded.columns) == ["A", "B"] and loaded.fields == panel.fields
+    np.testing.assert_array_equal(loaded.values, panel.values)
+
+
+def test_save_load_naive_and_empty(tmp_path):
+    naive = OHLCVPanel.from_asset_frames(
+        {"SBER": pd.DataFrame({"close": [1.0, 2.0], "volume": 1.0}, index=pd.date_range("2024-01-01", periods=2))}
+    )
+    naive.save(tmp_path / "naive.npz")
+    loaded = OHLCVPanel.load(tmp_path / "naive.npz")
+    assert loaded.index.tz is None and loaded.index.equals(naive.index)
+
+    empty = OHLCVPanel.from_asset_frames({})
+    assert empty.empty
+    empty.save(tmp_path / "empty.npz")
+    loaded = OHLCVPanel.load(tmp_path / "empty.npz")
+    assert loaded.empty and loaded.shape == empty.shape
+
+
+def test_panels_compare_by_identity(frames):
+    a = OHLCVPanel.from_asset_frames(frames)
+    b = OHLCVPanel.from_asset_frames(frames)
+
+    assert a == a and a != b  # no ambiguous array truth value
+
+
+def test_liquidity_filter_never_holds_zero_volume_asset():
+    rng = np.random.default_rng(3)
+    idx = pd.date_range("2023-01-01", periods=200)
+    frames = {}
+    for i in range(8):
+        close = np.exp(np.cumsum(rng.normal(0.0, 0.02, len(idx))))
+        frames[f"A{i}"] = pd.DataFrame({"close": close, "volume": 1e4}, index=idx)
+    # strongest momentum, but never traded
+    frames["DEAD"] = pd.DataFrame({"close": np.exp(np.linspace(0, 2, len(idx))), "volume": 0.0}, index=idx)
+    panel = OHLCVPanel.from_asset_frames(frames)
+
+    params = BacktestParams(lookback=20, rebalance_days=5, top_n=2, bottom_n=2, min_traded_value=1.0)
+    res = run_momentum_backtest(panel.close, params, panel=panel)
+
+    assert (res["weights"]["DEAD"] == 0).all()
+    assert (res["weights"].abs().sum(axis=1).iloc[-1]) == pytest.approx(params.gross_exposure)
+
+    unfiltered = run_momentum_backtest(panel.close, BacktestParams(lookback=20, rebalance_days=5, top_n=2, bottom_n=2))
+    assert (unfiltered["weights"]["DEAD"] > 0).any()  # the filter is what keeps it out
@@ -0,0 +1,130 @@
+import time
+from datetime import datetime, timezone
+
+import pandas as pd
+import pytest
+
+from momentum_bt import prewarm
+from momentum_bt.backtest import SPARSE_WEIGHTS_MIN_ASSETS, BacktestParams, fit_top_bottom
+from momentum_bt.data.panel import OHLCVPanel
+from momentum_bt.defaults import APP_DEFAULT_PARAMS as DEFAULTS
+from momentum_bt.defaults import DEFAULT_CRYPTO_SYMBOLS, DEFAULT_END, DEFAULT_START
+
+
+def _to_utc_dt(d) -> datetime:
+    return datetime(d.year, d.month, d.day, tzinfo=timezone.utc)
+
+
+def app_params(n_assets: int, **overrides) -> BacktestParams:
+    """Params exactly as app.py builds them from untouched sidebar widgets."""
+    p = {k: getattr(DEFAULTS, k) for k in DEFAULTS.__dataclass_fields__}
+    p.update(overrides)
+    top_n, bottom_n = int(p["top_n"]), int(p["bottom_n"])
+    if top_n + bottom_n > n_assets:
+        top_n, bottom_n = fit_top_bottom(top_n, bottom_n, n_assets)
+    return BacktestParams(
+        lookback=int(p["lookback"]),
+        rebalance_days=int(p["rebalance_days"]),
+        top_n=int(top_n),
+        bottom_n=int(bottom_n),
+        transaction_cost=float(p["transaction_cost"]),
+        gross_exposure=float(p["gross_exposure"]),
+        min_traded_value=float(p["min_traded_value"]),
+        liquidity_window=int(p["liquidity_window"]),
+        capital=float(p["capital"]),
+        impact_coef=float(p["impact_coef"]),
+        max_participation=float(p["max_participation"]),
+        sparse_weights=n_assets > SPARSE_WEIGHTS_MIN_ASSETS,
+        weighting=p["weighting"],
+        vol_window=int(p["vol_window"]),
+        ewma_halflife=float(p["ewma_halflife"]),
+    )
+
+
+def _panel(prices: pd.DataFrame) -> OHLCVPanel:
+    return OHLCVPanel.from_asset_frames(
+        {c: pd.DataFrame({"close": prices[c], "volume": 1e6}, index=prices.index) for c in prices}
+    )
+
+
+HISTORY = {"2022-01-03": ["A00", "A01", "A02", "A03"], "2022-06-01": ["A01", "A02", "A03", "A04", "A05"]}
+
+
+@pytest.fixture
+def published(tmp_path, monkeypatch, random_prices):
+    """Publish dir in tmp_path with all downloads replaced by synthetic data."""
+    monkeypatch.setenv("MOMENTUM_BT_PUBLISH_DIR", str(tmp_path))
+    crypto = random_prices.iloc[:, :5].set_axis(list(DEFAULT_CRYPTO_SYMBOLS), axis=1)
+    monkeypatch.setattr(prewarm, "build_crypto_panel", lambda symbols, **kw: _panel(crypto[symbols]))
+    monkeypatch.setattr(prewarm, "build_moex_panel", lambda tickers, **kw: _panel(random_prices[tickers]))
+    monkeypatch.setattr(prewarm, "load_imoex_history", lambda start, end: HISTORY)
+    monkeypatch.setattr(prewarm, "load_imoex_universe", lambda: ["A01", "A02"])
+    return tmp_path
+
+
+def test_run_all_publishes_and_expires(published):
+    assert prewarm.run_all()
+
+    for name in ("crypto", "imoex"):
+        assert {p.name for p in (published / name).iterdir()} == {"meta.json", "panel.npz", "result.pkl"}
+        pub = prewarm.load_published(name)
+        assert pub is not None and pub.age_s < 60
+        assert not pub.panel.empty and "net_ret" in pub.result
+
+    assert prewarm.load_published("crypto", max_age_s=-1) is None
+    assert prewarm.load_published("missing") is None
+
+
+def test_published_runs_match_app_requests(published):
+    prewarm.run_all()
+    start, end = _to_utc_dt(DEFAULT_START.date()), _to_utc_dt(DEFAULT_END.date())
+
+    crypto = prewarm.load_published("crypto")
+    assert crypto.matches_data(list(DEFAULT_CRYPTO_SYMBOLS), start, end)
+    assert not crypto.matches_data(["BTCUSDT"], start, end)
+    # 5 symbols: top/bottom 10/10 are auto-fitted the same way in both places
+    assert crypto.matches_run(app_params(5), None)
+    assert not crypto.matches_run(app_params(5), "listing")
+    assert not crypto.matches_run(app_params(5, lookback=90), None)
+
+    imoex = prewarm.load_published("imoex")
+    tickers = sorted({t for ts in HISTORY.values() for t in ts})
+    assert imoex.meta["current_universe"] == ["A01", "A02"]
+    assert imoex.matches_data(tickers, start, end, "TQBR")
+    assert not imoex.matches_data(tickers, start, end, "SMAL")
+    assert imoex.matches_run(app_params(len(tickers)), "imoex_pit")
+    assert not imoex.matches_run(app_params(len(tickers)), None)
+    assert not imoex.matches_run(app_params(len(tickers), weighting="inverse_vol"), "imoex_pit")
+
+
+def test_sparse_flag_follows_app_threshold(published):
+    prewarm.run_all()
+
+    pub = prewarm.load_published("imoex")
+    n_assets = pub.meta["n_assets"]
+    assert pub.meta["params"]["sparse_weights"] == (n_assets > SPARSE_WEIGHTS_MIN_ASSETS)
+    flipped = app_params(n_assets)
+    flipped = BacktestParams(**{**flipped.__dict__, "sparse_weights": not flipped.sparse_weights})
+    assert not pub.matches_run(flipped, "imoex_pit")
+
+
+def test_format_status_after_failed_config(published, monkeypatch):
+    prewarm.run_all()
+    refreshed = prewarm.load_published("imoex").meta["refreshed_at"]
+
+    def broken(**kw):
+        raise ConnectionError("ISS is down")
+
+    monkeypatch.setattr(prewarm, "build_moex_panel", broken)
+    assert not prewarm.run_all()
+
+    # the last good publish stays readable and its refresh time stays in the status
+    assert prewarm.load_published("imoex") is not None
+    lines = prewarm.format_status(now=refreshed + 7200).splitlines()
+    assert lines[0].startswith("crypto   ok")
+    assert lines[1].startswith("imoex    FAILED refreshed 2.0h ago")
+    assert lines[1].endswith("(ConnectionError: ISS is down)")
+
+
+def test_format_status_without_runs(published):
+    assert prewarm.format_status() == "no pre-warm runs recorded"
@@ -0,0 +1,53 @@
+from dataclasses import replace
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_bt.backtest import BacktestParams, run_momentum_backtest
+from momentum_bt.data.panel import OHLCVPanel
+
+
+def _panel(prices: pd.DataFrame) -> OHLCVPanel:
+    rng = np.random.default_rng(7)
+    volume = pd.DataFrame(rng.uniform(1e3, 1e5, prices.shape), index=prices.index, columns=prices.columns)
+    volume.iloc[:, 5] = 0.0  # never traded
+    frames = {
+        c: pd.DataFrame({"close": prices[c], "volume": volume[c]}).dropna()
+        for c in prices.columns
+    }
+    return OHLCVPanel.from_asset_frames(frames)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        BacktestParams(lookback=20, rebalance_days=10, top_n=5, bottom_n=5),
+        BacktestParams(lookback=60, rebalance_days=21, top_n=3, bottom_n=2, gross_exposure=1.5),
+        BacktestParams(lookback=20, rebalance_days=7, top_n=5, bottom_n=5, weighting="inverse_vol"),
+        BacktestParams(lookback=20, rebalance_days=7, top_n=4, bottom_n=4, weighting="risk_parity"),
+        BacktestParams(lookback=20, rebalance_days=10, top_n=5, bottom_n=5, capital=1e6, min_traded_value=1e3),
+    ],
+)
+def test_sparse_matches_dense(random_prices, params):
+    panel = _panel(random_prices)
+    prices = panel.close
+
+    dense = run_momentum_backtest(prices, params, panel=panel)
+    sparse = run_momentum_backtest(prices, replace(params, sparse_weights=True), panel=panel)
+
+    pd.testing.assert_frame_equal(sparse["weights"].to_dense(), dense["weights"], check_freq=False)
+    for key in ("gross_ret", "turnover", "slippage", "costs", "net_ret", "equity"):
+        pd.testing.assert_series_equal(sparse[key], dense[key], check_names=False, check_freq=False, atol=1e-12)
+
+
+def test_sparse_latest_matches_last_dense_row(random_prices):
+    params = BacktestParams(lookback=20, rebalance_days=10, top_n=5, bottom_n=5)
+    dense = run_momentum_backtest(random_prices, params)
+    sparse = run_momentum_backtest(random_prices, replace(params, sparse_weights=True))
+
+    last = dense["weights"].iloc[-1]
+    pd.testing.assert_series_equal(
+        sparse["weights"].latest().sort_index(), last[last != 0].sort_index(), check_names=False
+    )
+    assert sparse["weights"].nnz <= len(sparse["rebalance_dates"]) * (params.top_n + params.bottom_n)
@@ -0,0 +1,22 @@
+import pandas as pd
+
+from momentum_bt.features.volatility import ewma_covariance, ewma_horizon, rolling_volatility
+
+
+def test_rolling_volatility_matches_pandas(random_prices):
+    returns = random_prices.pct_change(fill_method=None)
+
+    expected = returns.rolling(20).std()
+    pd.testing.assert_frame_equal(rolling_volatility(returns, 20), expected, rtol=1e-8)
+
+
+def test_ewma_covariance_uses_only_the_horizon_tail(random_prices):
+    returns = random_prices.pct_change(fill_method=None).iloc[:, :4]
+    horizon = ewma_horizon(5.0, 60)
+
+    full = ewma_covariance(returns, 5.0, min_periods=60)
+    tail = ewma_covariance(returns.iloc[-horizon:], 5.0, min_periods=60)
+
+    assert horizon == 100
+    pd.testing.assert_frame_equal(full, tail)
+    assert ewma_covariance(returns.iloc[-59:], 5.0, min_periods=60) is None
@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from momentum_bt.features.volatility import ewma_covariance
+from momentum_bt.portfolio.weights import WEIGHTING_SCHEMES, _risk_parity, build_long_short_weights
+
+
+ASSETS = ["a", "b", "c", "d", "e", "f"]
+
+
+def _cov(vols, corr) -> pd.DataFrame:
+    vols = np.asarray(vols)
+    return pd.DataFrame(np.asarray(corr) * np.outer(vols, vols))
+
+
+@pytest.fixture
+def negative_corr_leg_cov():
+    """Long leg a/b/c with rho_ab = rho_ac = -0.6, rho_bc = 0.5; short leg uncorrelated."""
+    corr = np.eye(6)
+    corr[0, 1] = corr[1, 0] = corr[0, 2] = corr[2, 0] = -0.6
+    corr[1, 2] = corr[2, 1] = 0.5
+    cov = _cov([0.02, 0.03, 0.05, 0.01, 0.02, 0.04], corr)
+    cov.index = cov.columns = ASSETS
+    return lambda assets: cov.loc[assets, assets]
+
+
+@pytest.mark.parametrize("weighting", WEIGHTING_SCHEMES)
+@pytest.mark.parametrize("gross", [1.0, 2.0])
+def test_leg_gross_preserved(weighting, gross, negative_corr_leg_cov):
+    scores = pd.Series([3.0, 2.0, 1.0, -1.0, -2.0, -3.0], index=ASSETS)
+    vol = pd.Series([0.02, 0.03, 0.05, 0.01, 0.02, 0.04], index=ASSETS)
+
+    w = build_long_short_weights(
+        scores, top_n=3, bottom_n=3, gross_exposure=gross,
+        weighting=weighting, vol=vol, leg_cov=negative_corr_leg_cov,
+    )
+
+    assert np.isfinite(w).all()
+    assert (w[["a", "b", "c"]] > 0).all() and (w[["d", "e", "f"]] < 0).all()
+    assert w[w > 0].sum() == pytest.approx(gross / 2)
+    assert w[w < 0].sum() == pytest.approx(-gross / 2)
+
+
+def test_risk_parity_negative_correlation_equal_contributions(negative_corr_leg_cov):
+    cov = negative_corr_leg_cov(["a", "b", "c"]).to_numpy()
+    w = _risk_parity(cov)
+
+    assert w is not None and (w > 0).all()
+    rc = w * (cov @ w)
+    assert np.allclose(rc / rc.sum(), 1.0 / 3.0)
+
+
+def test_risk_parity_rejects_degenerate_cov():
+    assert _risk_parity(np.array([[0.0, 0.0], [0.0, 1.0]])) is None
+    assert _risk_parity(np.array([[np.nan, 0.0], [0.0, 1.0]])) is None
+
+
+def test_ewma_covariance_requires_min_periods():
+    rng = np.random.default_rng(0)
+    rets = pd.DataFrame(rng.normal(0.0, 0.01, (300, 3)), columns=["a", "b", "new"])
+    rets.iloc[:-10, 2] = np.nan  # 10 days of history
+
+    assert ewma_covariance(rets, halflife=30, min_periods=60) is None
+    assert ewma_covariance(rets[["a", "b"]], halflife=30, min_periods=60) is not None
+
+
+def test_risk_parity_short_history_falls_back_not_overweighted():
+    rng = np.random.default_rng(1)
+    rets = pd.DataFrame(rng.normal(0.0, 0.01, (300, 3)), columns=["a", "b", "new"])
+    rets.iloc[:-10, 2] = np.nan
+    rets.iloc[-10:, 2] *= 4.0  # new listing, 4x as volatile
+
+    vol = rets.rolling(60).std().iloc[-1]  # NaN for "new": no full window
+    scores = pd.Series([1.0, 2.0, 3.0, -1.0], index=["a", "b", "new", "short"])
+
+    w = build_long_short_weights(
+        scores, top_n=3, bottom_n=1, weighting="risk_parity", vol=vol,
+        leg_cov=lambda assets: ewma_covariance(rets.reindex(columns=assets), 30, min_periods=60),
+    )
+
+    longs = w[["a", "b", "new"]]
+    assert np.allclose(longs, longs.mean())  # equal-weight fallback, "new" not the largest